@@ -3,7 +3,7 @@ Central configuration module using Pydantic Settings.
 All values can be overridden via environment variables or a .env file.
 """
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional, Tuple
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -51,10 +51,31 @@ class Settings(BaseSettings):
         "classify": "qwen-classify",
     }
 
+    # ── Model Loading ─────────────────────────────────────────────────────────
+    # Load every configured model at startup instead of on first request.
+    PRELOAD_MODELS: bool = True
+    # Weight quantization.  On CUDA, int8/nf4 use 'bitsandbytes' and fp8
+    # needs compute capability >= 8.9.  On CPU only int8 applies (dynamic
+    # int8 Linear layers via torch); other modes load unquantized.
+    QUANTIZATION: Literal["none", "int8", "nf4", "fp8"] = "none"
+    # torch.compile the forward pass on CUDA and decode with a static KV
+    # cache so the per-token graph can be captured.  Adds warm-up time.
+    COMPILE_MODEL: bool = False
+
     # ── Inference Defaults ────────────────────────────────────────────────────
     DEFAULT_MAX_NEW_TOKENS: int = 512
     DEFAULT_TEMPERATURE: float = 0.2
     DEFAULT_TOP_P: float = 0.9
+    # Ask classify models for the bare category name and constrain decoding
+    # to the candidate labels, instead of generating a JSON object.
+    # Confidence is then always 1.0.
+    CLASSIFY_LABEL_ONLY: bool = False
+
+    # ── Micro-batching ────────────────────────────────────────────────────────
+    # Concurrent prompts for the same model arriving within the wait window
+    # are tokenized and generated together.  Set max size to 1 to disable.
+    INFERENCE_BATCH_MAX_SIZE: int = 16
+    INFERENCE_BATCH_WAIT_MS: float = 10.0
 
     # ── Per-Operation Hard Limits ──────────────────────────────────────────────
     # These cannot be exceeded regardless of user settings stored in DB.
@@ -71,11 +92,27 @@ class Settings(BaseSettings):
 
     # ── Daily Limit Defaults (stored in DB, overridable via /limits) ──────────
     DEFAULT_DAILY_LIMIT: int = 1000
+    # Usage is counted in memory and written to SQLite every interval, or
+    # sooner once an operation has this many unflushed requests.  Counters
+    # are per process, which matches the single-worker deployment.
+    USAGE_FLUSH_INTERVAL: float = 2.0  # seconds
+    USAGE_FLUSH_MAX_PENDING: int = 100
+
+    # ── Health ────────────────────────────────────────────────────────────────
+    HEALTH_METRICS_TTL: float = 5.0  # seconds /health reuses CPU/memory samples
 
     # ── Logging ───────────────────────────────────────────────────────────────
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: Literal["text", "json"] = "text"  # json: one orjson object per line
     LOG_ROTATION_BYTES: int = 10 * 1024 * 1024  # 10 MB
     LOG_BACKUP_COUNT: int = 5
 
 
 settings = Settings()
+
+# Settings are immutable after startup, so resolve (operation, folder, path)
+# once instead of re-joining MODELS_DIR / folder on every lookup.
+OPERATION_MODEL_PATHS: Tuple[Tuple[str, str, Path], ...] = tuple(
+    (operation, folder, settings.MODELS_DIR / folder)
+    for operation, folder in settings.OPERATION_MODEL_MAP.items()
+)
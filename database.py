@@ -8,22 +8,56 @@ from datetime import date, datetime
 from typing import AsyncGenerator
 
 from sqlalchemy import (
-    Column, Date, DateTime, Float, Integer, String, select, update,
+    Column, Date, DateTime, Float, Index, Integer, String, delete, event, func, select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine,
 )
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# A pool of long-lived connections: WAL and the page cache only pay off when
+# they are not thrown away with a cold connection on every request, and each
+# concurrent session needs its own connection so transactions don't interleave.
 _engine = create_async_engine(
     f"sqlite+aiosqlite:///{settings.DB_PATH}",
     echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=20,
+    pool_timeout=5,
+    pool_recycle=1800,
+    pool_pre_ping=True,
     connect_args={"check_same_thread": False},
 )
 
+# Applied once per DBAPI connection.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-20000",    # ~20 MB (negative = KiB)
+    "PRAGMA busy_timeout=5000",
+)
+
+
+@event.listens_for(_engine.sync_engine, "connect")
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 AsyncSessionFactory = async_sessionmaker(
     bind=_engine,
     expire_on_commit=False,
@@ -41,42 +75,109 @@ class OperationLimit(Base):
     id: int = Column(Integer, primary_key=True, autoincrement=True)
     operation: str = Column(String(64), unique=True, nullable=False, index=True)
     daily_limit: int = Column(Integer, nullable=False, default=1000)
-    updated_at: datetime = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Rendered as CURRENT_TIMESTAMP (UTC) so SQLite fills it in, not Python.
+    updated_at: datetime = Column(
+        DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
 
 
 class UsageLog(Base):
     __tablename__ = "usage_log"
+    __table_args__ = (
+        # Conflict target for the per-request usage UPSERT.
+        Index("ix_usage_log_operation_date", "operation", "log_date", unique=True),
+    )
 
     id: int = Column(Integer, primary_key=True, autoincrement=True)
     operation: str = Column(String(64), nullable=False, index=True)
     log_date: date = Column(Date, nullable=False, index=True)
     request_count: int = Column(Integer, nullable=False, default=0)
     total_tokens: int = Column(Integer, nullable=False, default=0)
-    last_updated: datetime = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Rendered as CURRENT_TIMESTAMP (UTC) so SQLite fills it in, not Python.
+    last_updated: datetime = Column(
+        DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
+
+
+async def _merge_duplicate_usage_rows(conn: AsyncConnection) -> None:
+    """
+    Collapse duplicate (operation, log_date) usage rows into the oldest one.
+
+    Databases written before the unique index existed can hold several rows
+    per key, and creating the index over them would fail.
+    """
+    duplicates = (
+        await conn.execute(
+            select(
+                UsageLog.operation,
+                UsageLog.log_date,
+                func.min(UsageLog.id),
+                func.sum(UsageLog.request_count),
+                func.sum(UsageLog.total_tokens),
+                func.max(UsageLog.last_updated),
+            )
+            .group_by(UsageLog.operation, UsageLog.log_date)
+            .having(func.count() > 1)
+        )
+    ).all()
+
+    for operation, log_date, keep_id, requests, tokens, last_updated in duplicates:
+        await conn.execute(
+            update(UsageLog)
+            .where(UsageLog.id == keep_id)
+            .values(
+                request_count=requests,
+                total_tokens=tokens,
+                last_updated=last_updated,
+            )
+        )
+        await conn.execute(
+            delete(UsageLog).where(
+                UsageLog.operation == operation,
+                UsageLog.log_date == log_date,
+                UsageLog.id != keep_id,
+            )
+        )
+
+    if duplicates:
+        logger.warning(
+            "Merged duplicate usage_log rows for %d (operation, date) pairs.",
+            len(duplicates),
+        )
 
 
 async def init_db() -> None:
     """Create tables and seed default limits."""
     async with _engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-
-    async with AsyncSessionFactory() as session:
-        for operation in settings.OPERATION_MODEL_MAP:
-            result = await session.execute(
-                select(OperationLimit).where(OperationLimit.operation == operation)
-            )
-            existing = result.scalar_one_or_none()
-            if not existing:
-                session.add(
-                    OperationLimit(
-                        operation=operation,
-                        daily_limit=settings.DEFAULT_DAILY_LIMIT,
-                    )
+        # create_all() skips indexes on tables that already exist, and the
+        # unique index can only be built once duplicate rows are gone.
+        await _merge_duplicate_usage_rows(conn)
+        for index in UsageLog.__table__.indexes:
+            await conn.run_sync(index.create, checkfirst=True)
+
+    # Seed every operation in one INSERT OR IGNORE; existing limits are kept.
+    if settings.OPERATION_MODEL_MAP:
+        async with AsyncSessionFactory() as session:
+            await session.execute(
+                sqlite_insert(OperationLimit)
+                .values(
+                    [
+                        {"operation": operation, "daily_limit": settings.DEFAULT_DAILY_LIMIT}
+                        for operation in settings.OPERATION_MODEL_MAP
+                    ]
                 )
-        await session.commit()
+                .on_conflict_do_nothing(index_elements=["operation"])
+            )
+            await session.commit()
     logger.info("Database initialised at: %s", settings.DB_PATH)
 
 
+def pool_status() -> str:
+    """Human-readable connection pool status (size, checked in/out, overflow)."""
+    return _engine.pool.status()
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionFactory() as session:
         yield session
@@ -3,24 +3,65 @@ HealthCheck: collects system and platform metrics for the /health endpoint.
 """
 import time
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional, Tuple
 
-import psutil
-
-from app.core.config import settings
+from app.core.config import OPERATION_MODEL_PATHS, settings
 from app.models.model_registry import model_registry
 from app.schemas.response_schema import HealthResponse, ModelStatus
 
 _START_TIME: float = time.time()
 
+_TTL: float = settings.HEALTH_METRICS_TTL
+_MB: float = 1.0 / (1024 * 1024)
+
+# psutil module once imported, and the length of the first, priming CPU sample.
+_PSUTIL: Any = None
+_CPU_PRIME_INTERVAL: float = 0.1
+
+# (sampled_at, virtual_memory, cpu_percent) – refreshed at most every _TTL s.
+_METRICS_CACHE: Optional[Tuple[float, Any, float]] = None
+
+# (loaded folders, statuses, all_loaded) – rebuilt only when the loaded set changes.
+_STATUS_CACHE: Optional[Tuple[Tuple[str, ...], List[ModelStatus], bool]] = None
+
 
 class HealthCheck:
 
     @staticmethod
-    def _collect_model_statuses() -> List[ModelStatus]:
+    def _sample_system_metrics() -> Tuple[Any, float]:
+        """Return (virtual_memory, cpu_percent), sampled at most every _TTL s."""
+        global _METRICS_CACHE, _PSUTIL
+        now = time.monotonic()
+        if _METRICS_CACHE is not None and now - _METRICS_CACHE[0] < _TTL:
+            return _METRICS_CACHE[1], _METRICS_CACHE[2]
+
+        if _PSUTIL is None:
+            # Lazy import – psutil is only needed once /health is actually
+            # polled. cpu_percent(interval=None) reports usage since the
+            # previous call and returns a meaningless 0.0 the first time, so
+            # take one short blocking sample here; it also primes the counter
+            # for the non-blocking calls that follow.
+            import psutil
+
+            _PSUTIL = psutil
+            cpu = psutil.cpu_percent(interval=_CPU_PRIME_INTERVAL)
+        else:
+            cpu = _PSUTIL.cpu_percent(interval=None)
+
+        mem = _PSUTIL.virtual_memory()
+        _METRICS_CACHE = (now, mem, cpu)
+        return mem, cpu
+
+    @staticmethod
+    def _collect_model_statuses() -> Tuple[List[ModelStatus], bool]:
+        """Return (statuses, all_loaded)."""
+        global _STATUS_CACHE
+        loaded_key = tuple(model_registry.list_loaded())
+        if _STATUS_CACHE is not None and _STATUS_CACHE[0] == loaded_key:
+            return _STATUS_CACHE[1], _STATUS_CACHE[2]
+
         statuses: List[ModelStatus] = []
-        for operation, folder in settings.OPERATION_MODEL_MAP.items():
-            model_path = settings.MODELS_DIR / folder
+        for operation, folder, model_path in OPERATION_MODEL_PATHS:
             statuses.append(
                 ModelStatus(
                     name=f"{operation} ({folder})",
@@ -28,23 +69,23 @@ class HealthCheck:
                     path=str(model_path),
                 )
             )
-        return statuses
+        all_loaded = all(m.loaded for m in statuses)
+        _STATUS_CACHE = (loaded_key, statuses, all_loaded)
+        return statuses, all_loaded
 
     @classmethod
     def get_health(cls) -> HealthResponse:
-        mem = psutil.virtual_memory()
-        cpu = psutil.cpu_percent(interval=0.1)
+        mem, cpu = cls._sample_system_metrics()
         uptime = time.time() - _START_TIME
 
-        model_statuses = cls._collect_model_statuses()
-        all_loaded = all(m.loaded for m in model_statuses)
+        model_statuses, all_loaded = cls._collect_model_statuses()
         status = "healthy" if all_loaded else "degraded"
 
         return HealthResponse(
             status=status,
             uptime_seconds=round(uptime, 2),
-            memory_used_mb=round(mem.used / 1024 / 1024, 2),
-            memory_total_mb=round(mem.total / 1024 / 1024, 2),
+            memory_used_mb=round(mem.used * _MB, 2),
+            memory_total_mb=round(mem.total * _MB, 2),
             cpu_percent=cpu,
             models=model_statuses,
         )
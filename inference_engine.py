@@ -3,17 +3,192 @@ InferenceEngine: wraps tokenizer + model and exposes a clean generate() API.
 All prompt construction and decoding logic lives here.
 """
 import asyncio
+import copy
+import hashlib
+import threading
 import time
-from typing import Any, Optional
-
-import torch
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from app.core.config import settings
-from app.core.logging import get_logger
-from app.models.model_registry import LoadedModel
+from app.core.logging import INFO_ENABLED, get_logger
+from app.models.model_registry import LoadedModel, model_registry
 
 logger = get_logger(__name__)
 
+# Token id sequences generation is restricted to (e.g. classify labels).
+_AllowedSequences = Tuple[Tuple[int, ...], ...]
+
+# (max_new_tokens, temperature, top_p, prefix_key, allowed_sequences) – only
+# requests with identical generation parameters can share a model.generate()
+# call.
+_GenKey = Tuple[int, float, float, Optional[str], Optional[_AllowedSequences]]
+
+
+class _TokenIdCache:
+    """
+    Thread-safe LRU of prompt token ids keyed by SHA-256 of (model, prompt).
+    Repeated prompts (identical inputs, request_id retries) skip tokenization.
+    Shared by every model's executor thread, hence the lock.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, List[int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model_folder: str, prompt: str) -> bytes:
+        return hashlib.sha256(f"{model_folder}\0{prompt}".encode()).digest()
+
+    def get(self, key: bytes) -> Optional[List[int]]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if now - entry[0] >= self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: bytes, token_ids: List[int]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), token_ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+_TOKEN_CACHE = _TokenIdCache(maxsize=1024, ttl=600.0)
+
+
+class InferenceBatcher:
+    """
+    Per-model micro-batcher.  Collects prompts submitted concurrently within
+    a short window and runs them through a single batched generate() call.
+    """
+
+    def __init__(self, loaded: LoadedModel) -> None:
+        self._loaded = loaded
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._max_size = max(1, settings.INFERENCE_BATCH_MAX_SIZE)
+        self._wait_s = settings.INFERENCE_BATCH_WAIT_MS / 1000
+
+    async def submit(
+        self,
+        prompt: str,
+        max_new_tokens: int,
+        temperature: float,
+        top_p: float,
+        prefix_key: Optional[str] = None,
+        allowed_sequences: Optional[_AllowedSequences] = None,
+    ) -> tuple[str, int]:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._consume())
+
+        future: asyncio.Future = loop.create_future()
+        key = (max_new_tokens, temperature, top_p, prefix_key, allowed_sequences)
+        await self._queue.put((prompt, key, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[str, _GenKey, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._wait_s
+        while len(batch) < self._max_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _consume(self) -> None:
+        while True:
+            batch = await self._collect()
+
+            buckets: Dict[_GenKey, List[Tuple[str, asyncio.Future]]] = {}
+            for prompt, key, future in batch:
+                if not future.done():  # Caller may have been cancelled.
+                    buckets.setdefault(key, []).append((prompt, future))
+
+            for key, items in buckets.items():
+                prompts = [prompt for prompt, _ in items]
+                try:
+                    results = await InferenceEngine.generate_batch(self._loaded, prompts, *key)
+                except Exception as exc:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+
+                for (_, future), result in zip(items, results):
+                    if not future.done():
+                        future.set_result(result)
+
+
+class InferenceStream:
+    """
+    Async iterator over text chunks as the model emits them.
+    token_count is populated once the stream has been fully consumed.
+    """
+
+    def __init__(
+        self,
+        loaded: LoadedModel,
+        streamer: Any,
+        generation: asyncio.Future,
+        cancelled: threading.Event,
+    ) -> None:
+        self._loaded = loaded
+        self._streamer = streamer
+        self._generation = generation
+        self._cancelled = cancelled
+        self._start = time.perf_counter()
+        self.token_count = 0
+
+    def cancel(self) -> None:
+        """Stop generation after the current token (e.g. client went away)."""
+        self._cancelled.set()
+
+    async def wait(self) -> int:
+        """Wait for generation to finish and return the output token count."""
+        self.token_count = await self._generation
+        return self.token_count
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[str]:
+        async for chunk in self._streamer:
+            if chunk:
+                yield chunk
+        # Re-raises here if generate() failed in the worker thread.
+        await self.wait()
+
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        if INFO_ENABLED:
+            logger.info(
+                "Streaming inference complete | model=%s | tokens=%d | time=%.1fms",
+                self._loaded.folder,
+                self.token_count,
+                elapsed_ms,
+                extra={
+                    "model": self._loaded.folder,
+                    "stream": True,
+                    "output_tokens": self.token_count,
+                    "elapsed_ms": elapsed_ms,
+                },
+            )
+
 
 class InferenceEngine:
     """
@@ -21,6 +196,127 @@ class InferenceEngine:
     returns the generated text and a token count.
     """
 
+    @staticmethod
+    def _cache_kwargs(loaded: LoadedModel) -> Dict[str, Any]:
+        """Static KV cache for models compiled by ModelLoader (fixed shapes)."""
+        if settings.COMPILE_MODEL and loaded.device.startswith("cuda"):
+            return {"cache_implementation": "static"}
+        return {}
+
+    @staticmethod
+    def _encode(loaded: LoadedModel, prompts: List[str]) -> Any:
+        """
+        Tokenize prompts into padded tensors on the model's device, reusing
+        cached token ids for prompts seen recently.
+        """
+        tokenizer = loaded.tokenizer
+        keys = [_TOKEN_CACHE.key(loaded.folder, prompt) for prompt in prompts]
+        token_ids: List[Optional[List[int]]] = [_TOKEN_CACHE.get(key) for key in keys]
+
+        missing = [i for i, ids in enumerate(token_ids) if ids is None]
+        if missing:
+            encoded = tokenizer([prompts[i] for i in missing])["input_ids"]
+            for i, ids in zip(missing, encoded):
+                token_ids[i] = ids
+                _TOKEN_CACHE.put(keys[i], ids)
+
+        return tokenizer.pad({"input_ids": token_ids}, return_tensors="pt").to(loaded.device)
+
+    @staticmethod
+    def prefill_prefix(loaded: LoadedModel, prefix: str) -> Tuple[List[int], Any]:
+        """
+        Run the model over a fixed prompt prefix and return its token ids
+        together with the resulting KV cache.  Blocking; run on the model's
+        executor.
+        """
+        import torch
+        from transformers import DynamicCache
+
+        # Drop the last token: it may merge with whatever text follows the
+        # prefix, so it is not guaranteed to appear in the full prompt.
+        prefix_ids = loaded.tokenizer(prefix)["input_ids"][:-1]
+        input_ids = torch.tensor([prefix_ids], device=loaded.device)
+        with torch.inference_mode():
+            cache = loaded.model(
+                input_ids=input_ids, past_key_values=DynamicCache(), use_cache=True
+            ).past_key_values
+        return prefix_ids, cache
+
+    @classmethod
+    def _prefix_kwargs(
+        cls, loaded: LoadedModel, prefix_key: Optional[str], input_ids: Any
+    ) -> Dict[str, Any]:
+        """
+        generate() kwargs that resume from the cached KV state of the
+        operation's fixed prompt prefix, so only the variable suffix is
+        prefilled.  Empty when there is nothing usable to reuse.
+        """
+        prefix = PROMPT_PREFIXES.get(prefix_key) if prefix_key else None
+        if prefix is None or cls._cache_kwargs(loaded):
+            return {}
+
+        entry = loaded.prefix_cache.get(prefix_key)
+        if entry is None:
+            entry = loaded.prefix_cache[prefix_key] = cls.prefill_prefix(loaded, prefix)
+        prefix_ids, cache = entry
+
+        n = len(prefix_ids)
+        if not 0 < n < input_ids.shape[1] or input_ids[0, :n].tolist() != prefix_ids:
+            return {}
+        # generate() extends the cache in place, so each call gets a copy.
+        return {"past_key_values": copy.deepcopy(cache)}
+
+    @staticmethod
+    def label_token_ids(loaded: LoadedModel, labels: Tuple[str, ...]) -> _AllowedSequences:
+        """
+        Token ids of each label as the model would write it after the
+        classify prompt, for use as generate(allowed_sequences=...).
+        Memoized per (model folder, labels).
+        """
+        return _encode_labels(loaded.folder, labels)
+
+    @staticmethod
+    def _eos_token_ids(loaded: LoadedModel) -> List[int]:
+        """Token ids generate() stops on (generation_config, else tokenizer)."""
+        eos = loaded.model.generation_config.eos_token_id
+        if eos is None:
+            eos = loaded.tokenizer.eos_token_id
+        return list(eos) if isinstance(eos, (list, tuple)) else [eos]
+
+    @staticmethod
+    def _constraint_kwargs(
+        loaded: LoadedModel, allowed_sequences: Optional[_AllowedSequences], prompt_len: int
+    ) -> Dict[str, Any]:
+        """
+        generate() kwargs that only let the model emit one of
+        allowed_sequences followed by EOS (via PrefixConstrainedLogitsProcessor).
+        """
+        if not allowed_sequences:
+            return {}
+
+        # Any id generate() stops on may end a label; it must be one of
+        # those, or the forced end token would not stop generation.
+        eos_ids = InferenceEngine._eos_token_ids(loaded)
+        trie: Dict[int, Dict] = {}
+        for sequence in allowed_sequences:
+            node = trie
+            for token_id in sequence:
+                node = node.setdefault(token_id, {})
+            for eos_id in eos_ids:
+                node.setdefault(eos_id, {})
+
+        def allowed_tokens(batch_id: int, input_ids: Any) -> List[int]:
+            # Prompts are left-padded to a common length, so generated
+            # tokens start at prompt_len in every row.
+            node = trie
+            for token_id in input_ids[prompt_len:].tolist():
+                node = node.get(token_id)
+                if node is None:
+                    return eos_ids
+            return list(node) or eos_ids
+
+        return {"prefix_allowed_tokens_fn": allowed_tokens}
+
     @staticmethod
     def _run_inference(
         loaded: LoadedModel,
@@ -28,26 +324,37 @@ class InferenceEngine:
         max_new_tokens: int,
         temperature: float,
         top_p: float,
+        prefix_key: Optional[str] = None,
+        allowed_sequences: Optional[_AllowedSequences] = None,
     ) -> tuple[str, int]:
         """
         Synchronous (blocking) inference.  Must be called inside an executor
         so the asyncio event loop is never blocked.
         """
+        # Lazy import – keeps torch out of the import graph of non-inference
+        # code paths; already in sys.modules once a model has been loaded.
+        import torch
+
         tokenizer = loaded.tokenizer
         model = loaded.model
-        device = loaded.device
 
-        inputs = tokenizer(prompt, return_tensors="pt").to(device)
+        inputs = InferenceEngine._encode(loaded, [prompt])
         input_token_count = inputs["input_ids"].shape[1]
 
-        with torch.no_grad():
+        with torch.inference_mode():
             output_ids = model.generate(
                 **inputs,
                 max_new_tokens=max_new_tokens,
+                use_cache=True,
                 temperature=temperature,
                 top_p=top_p,
                 do_sample=temperature > 0,
                 pad_token_id=tokenizer.eos_token_id,
+                **InferenceEngine._cache_kwargs(loaded),
+                **InferenceEngine._prefix_kwargs(loaded, prefix_key, inputs["input_ids"]),
+                **InferenceEngine._constraint_kwargs(
+                    loaded, allowed_sequences, input_token_count
+                ),
             )
 
         # Decode only the newly generated tokens.
@@ -57,6 +364,202 @@ class InferenceEngine:
 
         return generated_text.strip(), output_token_count
 
+    @classmethod
+    def _run_batch_inference(
+        cls,
+        loaded: LoadedModel,
+        prompts: List[str],
+        max_new_tokens: int,
+        temperature: float,
+        top_p: float,
+        prefix_key: Optional[str] = None,
+        allowed_sequences: Optional[_AllowedSequences] = None,
+    ) -> List[tuple[str, int]]:
+        """
+        Synchronous batched inference over prompts sharing the same
+        generation parameters.  Returns one (text, token_count) per prompt.
+        The prefix KV cache only applies to single prompts (batch size 1).
+        """
+        if len(prompts) == 1:
+            return [
+                cls._run_inference(
+                    loaded,
+                    prompts[0],
+                    max_new_tokens,
+                    temperature,
+                    top_p,
+                    prefix_key,
+                    allowed_sequences,
+                )
+            ]
+
+        import torch
+
+        tokenizer = loaded.tokenizer
+        model = loaded.model
+
+        # Left-padded (see ModelLoader), so every row's prompt ends at the
+        # same column and the attention mask hides the padding.
+        inputs = cls._encode(loaded, prompts)
+        input_token_count = inputs["input_ids"].shape[1]
+
+        with torch.inference_mode():
+            output_ids = model.generate(
+                **inputs,
+                max_new_tokens=max_new_tokens,
+                use_cache=True,
+                temperature=temperature,
+                top_p=top_p,
+                do_sample=temperature > 0,
+                pad_token_id=tokenizer.pad_token_id,
+                **cls._cache_kwargs(loaded),
+                **cls._constraint_kwargs(loaded, allowed_sequences, input_token_count),
+            )
+
+        new_token_ids = output_ids[:, input_token_count:]
+        texts = tokenizer.batch_decode(new_token_ids, skip_special_tokens=True)
+        token_counts = cls._count_generated_tokens(loaded, new_token_ids)
+
+        return [(text.strip(), count) for text, count in zip(texts, token_counts)]
+
+    @staticmethod
+    def _count_generated_tokens(loaded: LoadedModel, new_token_ids: Any) -> List[int]:
+        """
+        Per-row output token count for a batched generate(), matching the
+        single-prompt count: everything up to and including the first stop
+        token. Rows that finish early are right-filled with pad tokens, and
+        pad often equals eos (see ModelLoader), so pad can't be counted out.
+        """
+        import torch
+
+        eos_ids = torch.tensor(
+            InferenceEngine._eos_token_ids(loaded), device=new_token_ids.device
+        )
+
+        is_stop = torch.isin(new_token_ids, eos_ids)
+        first_stop = is_stop.int().argmax(dim=1)
+        width = torch.full_like(first_stop, new_token_ids.shape[1])
+        return torch.where(is_stop.any(dim=1), first_stop + 1, width).tolist()
+
+    @staticmethod
+    def _run_streaming_inference(
+        loaded: LoadedModel,
+        prompt: str,
+        streamer: Any,
+        max_new_tokens: int,
+        temperature: float,
+        top_p: float,
+        cancelled: threading.Event,
+        prefix_key: Optional[str] = None,
+    ) -> int:
+        """
+        Synchronous inference that pushes decoded text into `streamer` as it
+        is generated.  Stops early once `cancelled` is set.  Returns the
+        output token count.
+        """
+        import torch
+        from transformers import StoppingCriteria, StoppingCriteriaList
+
+        class _Cancelled(StoppingCriteria):
+            def __call__(self, input_ids: Any, scores: Any, **kwargs: Any) -> bool:
+                return cancelled.is_set()
+
+        tokenizer = loaded.tokenizer
+        try:
+            inputs = InferenceEngine._encode(loaded, [prompt])
+            input_token_count = inputs["input_ids"].shape[1]
+
+            with torch.inference_mode():
+                output_ids = loaded.model.generate(
+                    **inputs,
+                    streamer=streamer,
+                    max_new_tokens=max_new_tokens,
+                    use_cache=True,
+                    temperature=temperature,
+                    top_p=top_p,
+                    do_sample=temperature > 0,
+                    pad_token_id=tokenizer.eos_token_id,
+                    stopping_criteria=StoppingCriteriaList([_Cancelled()]),
+                    **InferenceEngine._cache_kwargs(loaded),
+                    **InferenceEngine._prefix_kwargs(loaded, prefix_key, inputs["input_ids"]),
+                )
+        except Exception:
+            # generate() only closes the streamer on success; close it here
+            # so the consuming coroutine isn't left waiting forever.
+            streamer.end()
+            raise
+
+        return output_ids.shape[1] - input_token_count
+
+    @classmethod
+    def stream(
+        cls,
+        loaded: LoadedModel,
+        prompt: str,
+        max_new_tokens: int,
+        temperature: float = settings.DEFAULT_TEMPERATURE,
+        top_p: float = settings.DEFAULT_TOP_P,
+        prefix_key: Optional[str] = None,
+    ) -> InferenceStream:
+        """
+        Start generation on the model's executor and return an async
+        iterator over the text chunks.  Must be called from a coroutine.
+        """
+        from transformers import AsyncTextIteratorStreamer
+
+        streamer = AsyncTextIteratorStreamer(
+            loaded.tokenizer, skip_prompt=True, skip_special_tokens=True
+        )
+        cancelled = threading.Event()
+        loop = asyncio.get_running_loop()
+        generation = loop.run_in_executor(
+            loaded.executor,
+            cls._run_streaming_inference,
+            loaded,
+            prompt,
+            streamer,
+            max_new_tokens,
+            temperature,
+            top_p,
+            cancelled,
+            prefix_key,
+        )
+        return InferenceStream(loaded, streamer, generation, cancelled)
+
+    @classmethod
+    async def generate_batch(
+        cls,
+        loaded: LoadedModel,
+        prompts: List[str],
+        max_new_tokens: int,
+        temperature: float = settings.DEFAULT_TEMPERATURE,
+        top_p: float = settings.DEFAULT_TOP_P,
+        prefix_key: Optional[str] = None,
+        allowed_sequences: Optional[_AllowedSequences] = None,
+    ) -> List[tuple[str, int]]:
+        """
+        Run prompts sharing the same generation parameters as one padded
+        generate() call on the model's inference thread.  prefix_key names
+        an entry in PROMPT_PREFIXES whose KV state may be reused;
+        allowed_sequences restricts the output to one of the given token
+        id sequences.
+
+        Returns:
+            One (generated_text, output_token_count) per prompt, in order.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            loaded.executor,
+            cls._run_batch_inference,
+            loaded,
+            prompts,
+            max_new_tokens,
+            temperature,
+            top_p,
+            prefix_key,
+            allowed_sequences,
+        )
+
     @classmethod
     async def generate(
         cls,
@@ -65,65 +568,134 @@ class InferenceEngine:
         max_new_tokens: int,
         temperature: float = settings.DEFAULT_TEMPERATURE,
         top_p: float = settings.DEFAULT_TOP_P,
+        prefix_key: Optional[str] = None,
+        allowed_sequences: Optional[_AllowedSequences] = None,
     ) -> tuple[str, int]:
         """
-        Async wrapper around blocking inference.
+        Async wrapper around blocking inference.  Requests are routed through
+        the model's InferenceBatcher so concurrent prompts share one
+        generate() call.
 
         Returns:
             Tuple of (generated_text, output_token_count).
         """
-        loop = asyncio.get_event_loop()
         start = time.perf_counter()
 
-        text, token_count = await loop.run_in_executor(
-            None,
-            cls._run_inference,
-            loaded,
-            prompt,
-            max_new_tokens,
-            temperature,
-            top_p,
+        if loaded.batcher is None:
+            loaded.batcher = InferenceBatcher(loaded)
+        text, token_count = await loaded.batcher.submit(
+            prompt, max_new_tokens, temperature, top_p, prefix_key, allowed_sequences
         )
 
         elapsed_ms = (time.perf_counter() - start) * 1000
-        logger.info(
-            "Inference complete | model=%s | tokens=%d | time=%.1fms",
-            loaded.folder,
-            token_count,
-            elapsed_ms,
-        )
+        if INFO_ENABLED:
+            logger.info(
+                "Inference complete | model=%s | tokens=%d | time=%.1fms",
+                loaded.folder,
+                token_count,
+                elapsed_ms,
+                extra={
+                    "model": loaded.folder,
+                    "output_tokens": token_count,
+                    "elapsed_ms": elapsed_ms,
+                },
+            )
         return text, token_count
 
 
 # ── Prompt builders ───────────────────────────────────────────────────────────
 # Centralised here so changing prompt templates doesn't require touching
-# business logic in services.
+# business logic in services.  Static fragments are built once at import;
+# user text is spliced in with str.join and never passed through format().
+# Builders are memoized, so repeated inputs return the same prompt object.
+
+_SUMMARIZE_TEMPLATE: tuple[str, str] = (
+    "You are a professional summarization assistant.\n"
+    "Summarize the following text in exactly {max_sentences} concise sentence(s). "
+    "Write the summary in language code '{language}'. "
+    "Output only the summary text, nothing else.\n\n"
+    "TEXT:\n",
+    "\n\nSUMMARY:",
+)
 
+_TRANSLATE_TEMPLATE: tuple[str, str] = (
+    "You are a professional translation assistant.\n"
+    "Translate the following text from '{source_lang}' to '{target_lang}'. "
+    "Output only the translated text, nothing else.\n\n"
+    "TEXT:\n",
+    "\n\nTRANSLATION:",
+)
+
+_CLASSIFY_HEAD = (
+    "You are a text classification assistant.\n"
+    'Classify the following text into exactly one of these categories: "'
+)
+_CLASSIFY_BODY = (
+    '".\n'
+    "Respond with a JSON object only, in this exact format:\n"
+    '{"label": "<chosen_category>", "confidence": <0.0-1.0>}\n\n'
+    "TEXT:\n"
+)
+_CLASSIFY_LABEL_BODY = (
+    '".\n'
+    "Respond with the chosen category name only, exactly as written above.\n\n"
+    "TEXT:\n"
+)
+_CLASSIFY_TAIL = "\n\nCLASSIFICATION:"
+
+# Instruction text every prompt of an operation starts with (up to the first
+# templated value).  Keyed by operation for InferenceEngine's prefix KV cache.
+PROMPT_PREFIXES: Dict[str, str] = {
+    "summarize": _SUMMARIZE_TEMPLATE[0].split("{", 1)[0],
+    "translate": _TRANSLATE_TEMPLATE[0].split("{", 1)[0],
+    "classify": _CLASSIFY_HEAD,
+}
+
+
+@lru_cache(maxsize=256)
+def _encode_labels(model_folder: str, labels: Tuple[str, ...]) -> _AllowedSequences:
+    """
+    Encode each label as the continuation of _CLASSIFY_TAIL plus a space, so
+    byte-level BPE models get the space-prefixed tokens (" Sports") they
+    would naturally produce there; decoding strips the space again.
+    """
+    tokenizer = model_registry.get(model_folder).tokenizer
+    tail_ids = tokenizer(_CLASSIFY_TAIL, add_special_tokens=False)["input_ids"]
+    encoded = tokenizer(
+        [f"{_CLASSIFY_TAIL} {label}" for label in labels], add_special_tokens=False
+    )["input_ids"]
+
+    sequences = []
+    for label, ids in zip(labels, encoded):
+        if ids[: len(tail_ids)] == tail_ids:
+            sequences.append(tuple(ids[len(tail_ids):]))
+        else:
+            # The label merged with the tail's last token; encode it alone.
+            sequences.append(
+                tuple(tokenizer(f" {label}", add_special_tokens=False)["input_ids"])
+            )
+    return tuple(sequences)
+
+
+@lru_cache(maxsize=512)
 def build_summarize_prompt(text: str, max_sentences: int, language: str) -> str:
-    return (
-        f"You are a professional summarization assistant.\n"
-        f"Summarize the following text in exactly {max_sentences} concise sentence(s). "
-        f"Write the summary in language code '{language}'. "
-        f"Output only the summary text, nothing else.\n\n"
-        f"TEXT:\n{text}\n\nSUMMARY:"
+    head, tail = _SUMMARIZE_TEMPLATE
+    return "".join(
+        (head.format(max_sentences=max_sentences, language=language), text, tail)
     )
 
 
+@lru_cache(maxsize=512)
 def build_translate_prompt(text: str, source_lang: str, target_lang: str) -> str:
-    return (
-        f"You are a professional translation assistant.\n"
-        f"Translate the following text from '{source_lang}' to '{target_lang}'. "
-        f"Output only the translated text, nothing else.\n\n"
-        f"TEXT:\n{text}\n\nTRANSLATION:"
+    head, tail = _TRANSLATE_TEMPLATE
+    return "".join(
+        (head.format(source_lang=source_lang, target_lang=target_lang), text, tail)
     )
 
 
-def build_classify_prompt(text: str, categories: list[str]) -> str:
-    category_list = ", ".join(f'"{c}"' for c in categories)
-    return (
-        f"You are a text classification assistant.\n"
-        f"Classify the following text into exactly one of these categories: {category_list}.\n"
-        f"Respond with a JSON object only, in this exact format:\n"
-        f'{{"label": "<chosen_category>", "confidence": <0.0-1.0>}}\n\n'
-        f"TEXT:\n{text}\n\nCLASSIFICATION:"
-    )
+@lru_cache(maxsize=512)
+def build_classify_prompt(
+    text: str, categories: tuple[str, ...], label_only: bool = False
+) -> str:
+    body = _CLASSIFY_LABEL_BODY if label_only else _CLASSIFY_BODY
+    return "".join((_CLASSIFY_HEAD, '", "'.join(categories), body, text, _CLASSIFY_TAIL))
@@ -1,21 +1,46 @@
 """
 LimitService: manages per-operation daily request limits and usage tracking.
-All reads/writes go through SQLite.
+Usage is counted in-process and flushed to SQLite in the background;
+daily limits are cached in-process.
 """
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.database import OperationLimit, UsageLog
+from app.core.database import AsyncSessionFactory, OperationLimit, UsageLog
 from app.core.logging import get_logger
 from app.schemas.response_schema import LimitsResponse, OperationLimit as OpLimitSchema
 from app.schemas.response_schema import OperationUsage, UsageResponse
 
 logger = get_logger(__name__)
 
+# Seconds a cached daily limit is trusted before it is re-read from SQLite.
+_LIMIT_CACHE_TTL: float = 30.0
+
+# Hard caps are fixed at startup; bind the dicts once for per-row lookups.
+_MAX_IN: Dict[str, int] = settings.MAX_INPUT_CHARS
+_MAX_OUT: Dict[str, int] = settings.MAX_OUTPUT_TOKENS
+
+# (monotonic timestamp, date) – date.today() re-evaluated at most every 30s.
+_TODAY_CACHE: Tuple[float, date] = (float("-inf"), date.min)
+_TODAY_TTL: float = 30.0
+
+
+def _today() -> date:
+    global _TODAY_CACHE
+    now = time.monotonic()
+    if now - _TODAY_CACHE[0] >= _TODAY_TTL:
+        _TODAY_CACHE = (now, date.today())
+    return _TODAY_CACHE[1]
+
 
 class LimitExceededError(Exception):
     def __init__(self, operation: str, used: int, limit: int) -> None:
@@ -28,34 +53,102 @@ class LimitExceededError(Exception):
         )
 
 
+@dataclass
+class _UsageBucket:
+    """
+    In-memory usage for one (operation, date): the running totals, seeded
+    from SQLite, and the pending_* deltas not yet flushed back.
+    """
+
+    request_count: int
+    total_tokens: int = 0
+    pending_requests: int = 0
+    pending_tokens: int = 0
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.pending_requests or self.pending_tokens)
+
+
+_UsageKey = Tuple[str, date]
+
+_bucket_locks: Dict[_UsageKey, asyncio.Lock] = {}
+
+
+def _get_bucket_lock(key: _UsageKey) -> asyncio.Lock:
+    lock = _bucket_locks.get(key)
+    if lock is None:
+        lock = _bucket_locks[key] = asyncio.Lock()
+    return lock
+
+
 class LimitService:
 
-    @staticmethod
-    async def get_daily_limit(session: AsyncSession, operation: str) -> int:
+    # operation → (daily_limit, monotonic timestamp of the read)
+    _limit_cache: Dict[str, Tuple[int, float]] = {}
+
+    # (operation, date) → in-memory counters, seeded from SQLite on first use.
+    _usage_buckets: Dict[_UsageKey, _UsageBucket] = {}
+    _flush_task: Optional[asyncio.Task] = None
+    _flush_wakeup: Optional[asyncio.Event] = None
+    _flush_stop: Optional[asyncio.Event] = None
+
+    @classmethod
+    async def get_daily_limit(cls, session: AsyncSession, operation: str) -> int:
+        cached = cls._limit_cache.get(operation)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < _LIMIT_CACHE_TTL:
+            return cached[0]
+
         result = await session.execute(
             select(OperationLimit.daily_limit).where(
                 OperationLimit.operation == operation
             )
         )
         row = result.scalar_one_or_none()
-        return row if row is not None else settings.DEFAULT_DAILY_LIMIT
+        daily_limit = row if row is not None else settings.DEFAULT_DAILY_LIMIT
+        cls._limit_cache[operation] = (daily_limit, now)
+        return daily_limit
 
-    @staticmethod
-    async def _get_or_create_usage(
-        session: AsyncSession, operation: str, today: date
-    ) -> UsageLog:
-        result = await session.execute(
-            select(UsageLog).where(
-                UsageLog.operation == operation,
-                UsageLog.log_date == today,
-            )
-        )
-        usage = result.scalar_one_or_none()
-        if usage is None:
-            usage = UsageLog(operation=operation, log_date=today, request_count=0, total_tokens=0)
-            session.add(usage)
-            await session.flush()
-        return usage
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop all cached daily limits."""
+        cls._limit_cache.clear()
+
+    @classmethod
+    async def _get_bucket(
+        cls, session: AsyncSession, operation: str, today: date
+    ) -> _UsageBucket:
+        key = (operation, today)
+        bucket = cls._usage_buckets.get(key)
+        if bucket is not None:
+            return bucket
+
+        async with _get_bucket_lock(key):
+            bucket = cls._usage_buckets.get(key)
+            if bucket is None:
+                result = await session.execute(
+                    select(UsageLog.request_count, UsageLog.total_tokens).where(
+                        UsageLog.operation == operation,
+                        UsageLog.log_date == today,
+                    )
+                )
+                row = result.one_or_none()
+                bucket = (
+                    _UsageBucket(request_count=row[0], total_tokens=row[1])
+                    if row is not None
+                    else _UsageBucket(request_count=0)
+                )
+                cls._usage_buckets[key] = bucket
+        return bucket
+
+    @classmethod
+    def _maybe_wake_flusher(cls, bucket: _UsageBucket) -> None:
+        if (
+            cls._flush_wakeup is not None
+            and bucket.pending_requests >= settings.USAGE_FLUSH_MAX_PENDING
+        ):
+            cls._flush_wakeup.set()
 
     @classmethod
     async def check_and_increment(
@@ -68,41 +161,135 @@ class LimitService:
         Verify the daily limit is not exceeded, then record the request.
         Must be called BEFORE running inference so we fail fast.
 
+        Counting happens in memory against the cached daily limit; the
+        database is only read the first time an (operation, day) is seen.
+        The background flusher persists the counts (see flush()).
+
         Raises:
             LimitExceededError if daily limit is reached.
         """
-        today = date.today()
+        today = _today()
         daily_limit = await cls.get_daily_limit(session, operation)
+        bucket = await cls._get_bucket(session, operation, today)
 
-        if daily_limit == 0:
-            # 0 means disabled / no limit.
-            return
+        # No await between the check and the increment, so it is atomic on
+        # the event loop.  0 means disabled / no limit.
+        if daily_limit and bucket.request_count >= daily_limit:
+            raise LimitExceededError(operation, bucket.request_count, daily_limit)
 
-        usage = await cls._get_or_create_usage(session, operation, today)
+        bucket.request_count += 1
+        bucket.total_tokens += tokens_used
+        bucket.pending_requests += 1
+        bucket.pending_tokens += tokens_used
+        cls._maybe_wake_flusher(bucket)
 
-        if usage.request_count >= daily_limit:
-            raise LimitExceededError(operation, usage.request_count, daily_limit)
-
-        usage.request_count += 1
-        usage.total_tokens += tokens_used
-        await session.commit()
-        logger.debug(
-            "Usage recorded | op=%s | req=%d/%d | tokens=%d",
-            operation,
-            usage.request_count,
-            daily_limit,
-            usage.total_tokens,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Usage recorded | op=%s | req=%d/%d | pending=%d",
+                operation,
+                bucket.request_count,
+                daily_limit,
+                bucket.pending_requests,
+            )
 
     @classmethod
     async def record_tokens(
         cls, session: AsyncSession, operation: str, tokens: int
     ) -> None:
         """Update token count after inference completes."""
-        today = date.today()
-        usage = await cls._get_or_create_usage(session, operation, today)
-        usage.total_tokens += tokens
-        await session.commit()
+        bucket = await cls._get_bucket(session, operation, _today())
+        bucket.total_tokens += tokens
+        bucket.pending_tokens += tokens
+        cls._maybe_wake_flusher(bucket)
+
+    @classmethod
+    async def flush(cls) -> None:
+        """Persist pending usage deltas in a single transaction."""
+        today = _today()
+        deltas: List[Tuple[_UsageKey, int, int]] = []
+        for key, bucket in list(cls._usage_buckets.items()):
+            if bucket.dirty:
+                deltas.append((key, bucket.pending_requests, bucket.pending_tokens))
+                bucket.pending_requests = 0
+                bucket.pending_tokens = 0
+            elif key[1] != today:
+                # Previous day, fully flushed – no longer needed.
+                del cls._usage_buckets[key]
+                _bucket_locks.pop(key, None)
+
+        if not deltas:
+            return
+
+        try:
+            async with AsyncSessionFactory() as session:
+                for (operation, log_date), requests, tokens in deltas:
+                    await session.execute(
+                        sqlite_insert(UsageLog)
+                        .values(
+                            operation=operation,
+                            log_date=log_date,
+                            request_count=requests,
+                            total_tokens=tokens,
+                        )
+                        .on_conflict_do_update(
+                            index_elements=[UsageLog.operation, UsageLog.log_date],
+                            set_={
+                                "request_count": UsageLog.request_count + requests,
+                                "total_tokens": UsageLog.total_tokens + tokens,
+                                "last_updated": func.current_timestamp(),
+                            },
+                        )
+                    )
+                await session.commit()
+        except Exception:
+            # Put the deltas back so the next flush retries them.
+            for key, requests, tokens in deltas:
+                bucket = cls._usage_buckets.setdefault(key, _UsageBucket(request_count=0))
+                bucket.pending_requests += requests
+                bucket.pending_tokens += tokens
+            raise
+
+    @classmethod
+    async def _flush_loop(cls, wakeup: asyncio.Event, stop: asyncio.Event) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=settings.USAGE_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            if stop.is_set():
+                # stop_flusher() runs the final flush itself.
+                return
+            try:
+                await cls.flush()
+            except Exception:
+                logger.exception("Usage flush failed; will retry.")
+
+    @classmethod
+    def start_flusher(cls) -> None:
+        """Start the background usage flusher (call once at app startup)."""
+        if cls._flush_task is None or cls._flush_task.done():
+            cls._flush_wakeup = asyncio.Event()
+            cls._flush_stop = asyncio.Event()
+            cls._flush_task = asyncio.get_running_loop().create_task(
+                cls._flush_loop(cls._flush_wakeup, cls._flush_stop)
+            )
+
+    @classmethod
+    async def stop_flusher(cls) -> None:
+        """Stop the background flusher and persist anything still pending."""
+        if cls._flush_task is not None:
+            # Never cancel the task: a cancelled flush() has already zeroed
+            # the buckets' pending counts, and whether its commit landed is
+            # unknown, so the deltas can be neither restored nor dropped.
+            # Ask the loop to exit and let any in-progress flush finish.
+            cls._flush_stop.set()
+            cls._flush_wakeup.set()
+            await cls._flush_task
+            cls._flush_task = None
+            cls._flush_wakeup = None
+            cls._flush_stop = None
+        await cls.flush()
 
     @classmethod
     async def update_limit(
@@ -114,6 +301,7 @@ class LimitService:
             .values(daily_limit=daily_limit)
         )
         await session.commit()
+        cls._limit_cache.pop(operation, None)
         logger.info("Daily limit for '%s' updated to %d.", operation, daily_limit)
 
     @classmethod
@@ -124,8 +312,8 @@ class LimitService:
             OpLimitSchema(
                 operation=row.operation,
                 daily_limit=row.daily_limit,
-                max_input_chars=settings.MAX_INPUT_CHARS.get(row.operation, 0),
-                max_output_tokens=settings.MAX_OUTPUT_TOKENS.get(row.operation, 0),
+                max_input_chars=_MAX_IN.get(row.operation, 0),
+                max_output_tokens=_MAX_OUT.get(row.operation, 0),
             )
             for row in rows
         ]
@@ -133,22 +321,48 @@ class LimitService:
 
     @classmethod
     async def get_usage_response(cls, session: AsyncSession) -> UsageResponse:
-        today = date.today()
+        """
+        Today's usage per operation.  Read-only: operations counted in memory
+        report their bucket totals, which include deltas still pending or
+        mid-flush; the rest report what SQLite holds.
+        """
+        today = _today()
         results = await session.execute(
-            select(UsageLog).where(UsageLog.log_date == today)
+            select(
+                UsageLog,
+                func.coalesce(OperationLimit.daily_limit, settings.DEFAULT_DAILY_LIMIT),
+            )
+            .join(
+                OperationLimit,
+                UsageLog.operation == OperationLimit.operation,
+                isouter=True,
+            )
+            .where(UsageLog.log_date == today)
         )
-        rows = results.scalars().all()
+
+        totals: Dict[str, Tuple[int, int, int]] = {
+            row.operation: (row.request_count, row.total_tokens, daily_limit)
+            for row, daily_limit in results.all()
+        }
+        for (operation, log_date), bucket in list(cls._usage_buckets.items()):
+            if log_date != today:
+                continue
+            if operation in totals:
+                daily_limit = totals[operation][2]
+            else:
+                # Counted in memory but never flushed yet.
+                daily_limit = await cls.get_daily_limit(session, operation)
+            totals[operation] = (bucket.request_count, bucket.total_tokens, daily_limit)
 
         usage_list: List[OperationUsage] = []
-        for row in rows:
-            daily_limit = await cls.get_daily_limit(session, row.operation)
-            remaining = max(0, daily_limit - row.request_count) if daily_limit > 0 else -1
+        for operation, (request_count, total_tokens, daily_limit) in totals.items():
+            remaining = max(0, daily_limit - request_count) if daily_limit > 0 else -1
             usage_list.append(
                 OperationUsage(
-                    operation=row.operation,
+                    operation=operation,
                     date=str(today),
-                    request_count=row.request_count,
-                    total_tokens=row.total_tokens,
+                    request_count=request_count,
+                    total_tokens=total_tokens,
                     daily_limit=daily_limit,
                     remaining=remaining,
                 )
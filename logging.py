@@ -1,31 +1,113 @@
 """
 Centralized logging configuration.
 Provides a structured logger with rotating file handler and console handler.
+File writes happen on a background QueueListener thread, off the request path.
 """
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
+
+import orjson
 
 from app.core.config import settings
 
 
-_FORMATTER = logging.Formatter(
-    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-    datefmt="%Y-%m-%dT%H:%M:%S",
-)
+# LOG_LEVEL is fixed at startup and applied to every logger from get_logger(),
+# so hot paths test INFO_ENABLED instead of calling isEnabledFor() per request.
+LOG_LEVEL: int = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
+INFO_ENABLED: bool = LOG_LEVEL <= logging.INFO
+
+# Attributes every LogRecord has; anything else arrived via ``extra=``.
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class _JsonFormatter(logging.Formatter):
+    """Render each record as a single orjson-encoded line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Already rendered by _QueueHandler.prepare().
+            payload["exc_info"] = record.exc_text
+        return orjson.dumps(payload, default=str).decode()
+
+
+if settings.LOG_FORMAT == "json":
+    _FORMATTER: logging.Formatter = _JsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+else:
+    _FORMATTER = logging.Formatter(
+        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%S",
+    )
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records unformatted so the file sink applies _FORMATTER exactly
+    as the console does.  The stock prepare() formats the record itself,
+    folding any traceback into the message and dropping exc_info.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # Resolve args and the traceback now: args may change after the call
+        # returns, and a live traceback would pin its frames in the queue.
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
 
+# One queue handler (and listener thread) per log file, shared by all loggers
+# writing to that file.
+_QUEUE_HANDLERS: Dict[Path, logging.handlers.QueueHandler] = {}
+
+
+def _build_file_handler(log_path: Path) -> logging.handlers.QueueHandler:
+    """
+    Return a QueueHandler feeding a RotatingFileHandler for log_path.
+    The rotating handler runs on a QueueListener thread so disk I/O never
+    blocks the caller.
+    """
+    existing = _QUEUE_HANDLERS.get(log_path)
+    if existing is not None:
+        return existing
 
-def _build_file_handler(log_path: Path) -> logging.handlers.RotatingFileHandler:
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    handler = logging.handlers.RotatingFileHandler(
+    file_handler = logging.handlers.RotatingFileHandler(
         filename=str(log_path),
         maxBytes=settings.LOG_ROTATION_BYTES,
         backupCount=settings.LOG_BACKUP_COUNT,
         encoding="utf-8",
     )
-    handler.setFormatter(_FORMATTER)
+    file_handler.setFormatter(_FORMATTER)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Drain queued records on shutdown.
+
+    handler = _QueueHandler(log_queue)
+    _QUEUE_HANDLERS[log_path] = handler
     return handler
 
 
@@ -50,8 +132,7 @@ def get_logger(name: str, log_file: Optional[str] = None) -> logging.Logger:
         # Already configured – return as-is to prevent duplicate handlers.
         return logger
 
-    level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
-    logger.setLevel(level)
+    logger.setLevel(LOG_LEVEL)
 
     file_name = log_file or "platform.log"
     log_path = settings.LOGS_DIR / file_name
@@ -4,24 +4,32 @@ Main FastAPI application entry point.
 Startup sequence:
   1. Ensure log and model directories exist.
   2. Initialise SQLite database (tables + seed data).
-  3. Register all API routers.
-  4. Attach global exception handlers.
+  3. Preload configured models in parallel (PRELOAD_MODELS).
+  4. Register all API routers.
+  5. Attach global exception handlers.
 """
+import asyncio
 import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api import routes_limits, routes_operations, routes_settings
 from app.core.config import settings
 from app.core.database import init_db
-from app.core.logging import get_logger
+from app.core.logging import INFO_ENABLED, get_logger
+from app.models.model_loader import ModelLoader
+from app.models.model_registry import model_registry
+from app.services.limit_service import LimitExceededError, LimitService
+from app.services.orchestration_service import OrchestrationError
 
 logger = get_logger(__name__)
 
+_HTTP_LOG_FORMAT = "HTTP | %s %s | status=%d | time=%.1fms"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -33,12 +41,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings.MODELS_DIR.mkdir(parents=True, exist_ok=True)
 
     await init_db()
+    LimitService.start_flusher()
+
+    if settings.PRELOAD_MODELS:
+        try:
+            # Import once on this thread so the parallel loads below don't
+            # race through transformers' lazy module initialisation.
+            ModelLoader.import_backend()
+        except RuntimeError as exc:
+            # Every load would fail the same way, so don't attempt them.
+            logger.error("Skipping model preload: %s", exc)
+        else:
+            folders = sorted(set(settings.OPERATION_MODEL_MAP.values()))
+            results = await asyncio.gather(
+                *(model_registry.get_or_load(folder) for folder in folders),
+                return_exceptions=True,
+            )
+            for folder, result in zip(folders, results):
+                if isinstance(result, BaseException):
+                    # Not fatal: the model is retried lazily on first request
+                    # and /health reports the platform as degraded until then.
+                    logger.error("Preloading model '%s' failed: %s", folder, result)
+
     logger.info("Platform ready.")
 
     yield
 
     # ── Shutdown ──────────────────────────────────────────────────────────────
     logger.info("Shutting down %s.", settings.APP_NAME)
+    await LimitService.stop_flusher()
 
 
 app = FastAPI(
@@ -50,6 +81,7 @@ app = FastAPI(
         "No internet or external API dependencies."
     ),
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -60,15 +92,24 @@ app = FastAPI(
 
 @app.middleware("http")
 async def request_logging_middleware(request: Request, call_next):
+    if not INFO_ENABLED:
+        return await call_next(request)
+
     start = time.perf_counter()
     response = await call_next(request)
     elapsed_ms = (time.perf_counter() - start) * 1000
     logger.info(
-        "HTTP | %s %s | status=%d | time=%.1fms",
+        _HTTP_LOG_FORMAT,
         request.method,
         request.url.path,
         response.status_code,
         elapsed_ms,
+        extra={
+            "method": request.method,
+            "path": request.url.path,
+            "status": response.status_code,
+            "elapsed_ms": elapsed_ms,
+        },
     )
     return response
 
@@ -78,7 +119,7 @@ async def request_logging_middleware(request: Request, call_next):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     logger.warning("Validation error on %s: %s", request.url.path, exc.errors())
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": "Request validation failed.",
@@ -87,12 +128,32 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+@app.exception_handler(LimitExceededError)
+async def limit_exceeded_handler(request: Request, exc: LimitExceededError):
+    return ORJSONResponse(
+        status_code=429,
+        content={"error": "Daily limit exceeded.", "detail": str(exc)},
+    )
+
+
+@app.exception_handler(OrchestrationError)
+async def orchestration_exception_handler(request: Request, exc: OrchestrationError):
+    return ORJSONResponse(
+        status_code=422,
+        content={"error": "Operation failed.", "detail": str(exc)},
+    )
+
+
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
-    logger.exception("Unhandled exception on %s", request.url.path)
-    return JSONResponse(
+    # The exception text stays in the log; it can expose internals to clients.
+    logger.exception("Unhandled exception on %s: %s", request.url.path, exc)
+    return ORJSONResponse(
         status_code=500,
-        content={"error": "Internal server error.", "detail": str(exc)},
+        content={
+            "error": "Internal server error.",
+            "detail": "An unexpected internal error occurred.",
+        },
     )
 
 
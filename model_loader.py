@@ -2,11 +2,10 @@
 ModelLoader: loads Hugging Face-compatible models from the local filesystem.
 No internet access is used at any point.
 """
+import importlib.util
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-import torch
-
 from app.core.config import settings
 from app.core.logging import get_logger
 
@@ -22,6 +21,35 @@ class ModelLoader:
     reside in ./models/<model_folder_name>/.
     """
 
+    @staticmethod
+    def import_backend() -> Tuple[Any, Any, Any]:
+        """
+        Import torch and transformers.
+
+        transformers resolves its Auto* classes lazily and that first import
+        is not thread-safe, so callers about to run several load() calls in
+        parallel threads should call this once beforehand.
+
+        Returns:
+            Tuple of (torch, AutoModelForCausalLM, AutoTokenizer).
+
+        Raises:
+            RuntimeError: If either package is missing or fails to import.
+        """
+        try:
+            import torch
+            from transformers import AutoModelForCausalLM, AutoTokenizer
+        except ModuleNotFoundError as exc:
+            if exc.name in ("torch", "transformers"):
+                raise RuntimeError(
+                    f"The '{exc.name}' package is not installed. "
+                    "Run: pip install transformers torch"
+                ) from exc
+            raise RuntimeError(f"Failed to import torch/transformers: {exc}") from exc
+        except ImportError as exc:
+            raise RuntimeError(f"Failed to import torch/transformers: {exc}") from exc
+        return torch, AutoModelForCausalLM, AutoTokenizer
+
     @staticmethod
     def _resolve_model_path(model_folder: str) -> Path:
         model_path = settings.MODELS_DIR / model_folder
@@ -34,14 +62,104 @@ class ModelLoader:
 
     @staticmethod
     def _select_device() -> str:
+        import torch
+
         if torch.cuda.is_available():
             device = "cuda"
+            # Allow TF32 tensor cores for any fp32 matmuls left in the graph.
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.set_float32_matmul_precision("high")
             logger.info("CUDA available – loading model on GPU.")
         else:
             device = "cpu"
             logger.info("CUDA not available – loading model on CPU.")
         return device
 
+    @staticmethod
+    def _select_attn_implementation(device: str) -> Optional[str]:
+        """Fused attention kernels on GPU; library default elsewhere."""
+        if device != "cuda":
+            return None
+        if importlib.util.find_spec("flash_attn") is not None:
+            return "flash_attention_2"
+        return "sdpa"
+
+    @staticmethod
+    def _select_dtype(torch: Any, device: str) -> Any:
+        if device == "cuda":
+            return torch.float16
+        if settings.QUANTIZATION == "int8":
+            # Dynamic int8 quantization converts from fp32 weights.
+            return torch.float32
+        if ModelLoader._cpu_supports_bf16(torch):
+            logger.info("CPU has native bf16 support – loading weights in bfloat16.")
+            return torch.bfloat16
+        return torch.float32
+
+    @staticmethod
+    def _cpu_supports_bf16(torch: Any) -> bool:
+        """True when oneDNN can run bf16 kernels natively (AVX512-BF16/AMX)."""
+        if not torch.backends.mkldnn.is_available():
+            return False
+        try:
+            return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+        except (AttributeError, RuntimeError):
+            # Private op; absent on some builds – fall back to fp32.
+            return False
+
+    @staticmethod
+    def _build_quantization_config(torch: Any, device: str) -> Optional[Any]:
+        """Return the from_pretrained quantization_config for settings.QUANTIZATION."""
+        if settings.QUANTIZATION == "none":
+            return None
+        if device != "cuda":
+            if settings.QUANTIZATION != "int8":  # int8 is applied after loading.
+                logger.warning(
+                    "QUANTIZATION=%s requires CUDA – loading unquantized on %s.",
+                    settings.QUANTIZATION,
+                    device,
+                )
+            return None
+
+        if settings.QUANTIZATION == "fp8":
+            from transformers import FineGrainedFP8Config
+
+            return FineGrainedFP8Config()
+
+        from transformers import BitsAndBytesConfig
+
+        if settings.QUANTIZATION == "int8":
+            return BitsAndBytesConfig(load_in_8bit=True)
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_compute_dtype=torch.bfloat16,
+            bnb_4bit_quant_type="nf4",
+        )
+
+    @staticmethod
+    def _quantize_dynamic_int8(torch: Any, model: Any) -> Any:
+        """Swap Linear layers for int8 dynamic-quantized ones (CPU, fbgemm/VNNI)."""
+        logger.info("Applying dynamic int8 quantization to Linear layers.")
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    @staticmethod
+    def _compile_and_warm_up(torch: Any, tokenizer: Any, model: Any, device: str) -> None:
+        # Compile forward rather than the module so model.generate() – which
+        # lives on the unwrapped module – actually runs the compiled graph.
+        model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=False)
+
+        logger.info("Warming up compiled model (device=%s).", device)
+        inputs = tokenizer("warmup", return_tensors="pt").to(device)
+        with torch.inference_mode():
+            model.generate(
+                **inputs,
+                max_new_tokens=1,
+                cache_implementation="static",
+                pad_token_id=tokenizer.pad_token_id,
+            )
+
     @classmethod
     def load(cls, model_folder: str) -> Tuple[Any, Any, str]:
         """
@@ -58,13 +176,7 @@ class ModelLoader:
             RuntimeError:      If loading fails for any reason.
         """
         # Lazy import – only pay for torch/transformers when actually loading.
-        try:
-            from transformers import AutoModelForCausalLM, AutoTokenizer
-        except ImportError as exc:
-            raise RuntimeError(
-                "The 'transformers' package is not installed. "
-                "Run: pip install transformers torch"
-            ) from exc
+        torch, AutoModelForCausalLM, AutoTokenizer = cls.import_backend()
 
         model_path = cls._resolve_model_path(model_folder)
         device = cls._select_device()
@@ -75,18 +187,41 @@ class ModelLoader:
             local_files_only=True,
             trust_remote_code=True,
         )
+        # Decoder-only models must be left-padded for batched generation.
+        tokenizer.padding_side = "left"
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
 
         logger.info("Loading model from: %s (device=%s)", model_path, device)
-        dtype = torch.float16 if device == "cuda" else torch.float32
+        dtype = cls._select_dtype(torch, device)
+        model_kwargs: Dict[str, Any] = {}
+        attn_implementation = cls._select_attn_implementation(device)
+        if attn_implementation:
+            model_kwargs["attn_implementation"] = attn_implementation
+        quantization_config = cls._build_quantization_config(torch, device)
+        if quantization_config is not None:
+            model_kwargs["quantization_config"] = quantization_config
+        if device == "cuda":
+            # Stream shards straight onto the GPU (via accelerate) instead of
+            # materialising on CPU and copying every parameter with .to().
+            model_kwargs["device_map"] = {"": device}
         model = AutoModelForCausalLM.from_pretrained(
             str(model_path),
             local_files_only=True,
             trust_remote_code=True,
             torch_dtype=dtype,
             low_cpu_mem_usage=True,
+            **model_kwargs,
         )
-        model.to(device)
         model.eval()
 
+        if settings.QUANTIZATION == "int8" and device == "cpu":
+            model = cls._quantize_dynamic_int8(torch, model)
+
+        if settings.COMPILE_MODEL and device == "cuda":
+            cls._compile_and_warm_up(torch, tokenizer, model, device)
+
+        # Report where the weights actually live (e.g. "cuda:0").
+        device = str(next(model.parameters()).device)
         logger.info("Model '%s' loaded successfully on %s.", model_folder, device)
         return tokenizer, model, device
@@ -1,12 +1,14 @@
 """
 ModelRegistry: in-process store of loaded (tokenizer, model, device) triples.
 Implements lazy loading – a model is loaded only on first use.
-Thread-safety is achieved via asyncio.Lock (single-worker deployment).
+Concurrent loads are de-duplicated via a per-folder asyncio.Event
+(single-worker deployment).
 """
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -22,6 +24,13 @@ class LoadedModel:
     model: Any
     device: str
     loaded_at: float = field(default_factory=time.time)
+    # Single worker thread so generate() calls for this model run one at a
+    # time, while other models stay parallel.
+    executor: Optional[ThreadPoolExecutor] = None
+    # InferenceBatcher, attached lazily by InferenceEngine on first use.
+    batcher: Optional[Any] = None
+    # operation → (prefix token ids, KV cache), filled lazily by InferenceEngine.
+    prefix_cache: Dict[str, Tuple[List[int], Any]] = field(default_factory=dict)
 
 
 class ModelRegistry:
@@ -31,29 +40,32 @@ class ModelRegistry:
 
     def __init__(self) -> None:
         self._registry: Dict[str, LoadedModel] = {}
-        self._locks: Dict[str, asyncio.Lock] = {}
-
-    def _get_lock(self, model_folder: str) -> asyncio.Lock:
-        if model_folder not in self._locks:
-            self._locks[model_folder] = asyncio.Lock()
-        return self._locks[model_folder]
+        # model_folder → Event set once an in-flight load finishes (or fails).
+        self._loading: Dict[str, asyncio.Event] = {}
 
     async def get_or_load(self, model_folder: str) -> LoadedModel:
         """
         Return the LoadedModel for the given folder, loading it if necessary.
-        Concurrent callers for the same model will queue on the lock.
+        Concurrent callers for the same model wait on the in-flight load.
         """
-        if model_folder in self._registry:
-            return self._registry[model_folder]
-
-        async with self._get_lock(model_folder):
-            # Double-checked locking.
-            if model_folder in self._registry:
-                return self._registry[model_folder]
-
+        while True:
+            loaded = self._registry.get(model_folder)
+            if loaded is not None:
+                return loaded
+            event = self._loading.get(model_folder)
+            if event is None:
+                break
+            # Another caller is loading this model.  If that load fails the
+            # registry is still empty and we loop round to try ourselves.
+            await event.wait()
+
+        # No await between the check above and this insert, so exactly one
+        # caller per folder becomes the loader.
+        event = self._loading[model_folder] = asyncio.Event()
+        try:
             logger.info("Model '%s' not in registry – loading now.", model_folder)
             # Run blocking I/O in a thread pool so the event loop isn't blocked.
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             tokenizer, model, device = await loop.run_in_executor(
                 None, ModelLoader.load, model_folder
             )
@@ -62,10 +74,20 @@ class ModelRegistry:
                 tokenizer=tokenizer,
                 model=model,
                 device=device,
+                executor=ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"infer-{model_folder}"
+                ),
             )
             self._registry[model_folder] = loaded
             logger.info("Model '%s' registered successfully.", model_folder)
             return loaded
+        finally:
+            del self._loading[model_folder]
+            event.set()
+
+    def get(self, model_folder: str) -> Optional[LoadedModel]:
+        """Return the LoadedModel if already registered, without awaiting."""
+        return self._registry.get(model_folder)
 
     def is_loaded(self, model_folder: str) -> bool:
         return model_folder in self._registry
@@ -77,7 +99,10 @@ class ModelRegistry:
         """Unload a model from memory. Returns True if it was loaded."""
         if model_folder not in self._registry:
             return False
-        del self._registry[model_folder]
+        loaded = self._registry.pop(model_folder)
+        if loaded.executor is not None:
+            # Don't block the event loop; queued work still runs to completion.
+            loaded.executor.shutdown(wait=False)
         logger.info("Model '%s' unloaded from registry.", model_folder)
         return True
 
@@ -3,6 +3,8 @@ OperationService: thin application-layer facade over the orchestrator.
 Exists to keep routes free of direct orchestrator imports and to allow
 future middleware injection (auth context, audit, etc.) without touching routes.
 """
+from typing import Any, AsyncGenerator, Dict
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.request_schema import ClassifyRequest, SummarizeRequest, TranslateRequest
@@ -16,6 +18,12 @@ class OperationService:
     async def summarize(request: SummarizeRequest, session: AsyncSession) -> SummarizeResponse:
         return await OrchestrationService.summarize(request, session)
 
+    @staticmethod
+    async def summarize_stream(
+        request: SummarizeRequest, session: AsyncSession
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        return await OrchestrationService.summarize_stream(request, session)
+
     @staticmethod
     async def translate(request: TranslateRequest, session: AsyncSession) -> TranslateResponse:
         return await OrchestrationService.translate(request, session)
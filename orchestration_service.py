@@ -10,21 +10,27 @@ Responsibilities:
   - Log every execution
   - Handle and wrap all exceptions uniformly
 """
-import json
+import asyncio
+import re
 import time
-from typing import Any
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Optional, Set
+
+import orjson
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.logging import get_logger
+from app.core.database import AsyncSessionFactory
+from app.core.logging import INFO_ENABLED, get_logger
 from app.models.inference_engine import (
     InferenceEngine,
+    InferenceStream,
     build_classify_prompt,
     build_summarize_prompt,
     build_translate_prompt,
 )
-from app.models.model_registry import model_registry
+from app.models.model_registry import LoadedModel, model_registry
 from app.schemas.request_schema import ClassifyRequest, SummarizeRequest, TranslateRequest
 from app.schemas.response_schema import (
     ClassifyResponse,
@@ -37,6 +43,33 @@ from app.services.limit_service import LimitExceededError, LimitService
 logger = get_logger(__name__)
 
 
+# Settings are immutable after startup, so per-operation lookups are
+# resolved once at import.
+_OPERATIONS = ("summarize", "translate", "classify")
+_MODEL_FOLDER: Dict[str, str] = {
+    op: settings.OPERATION_MODEL_MAP[op]
+    for op in _OPERATIONS
+    if settings.OPERATION_MODEL_MAP.get(op)
+}
+_MAX_CHARS: Dict[str, int] = {op: settings.MAX_INPUT_CHARS.get(op, 0) for op in _OPERATIONS}
+
+# Usage-recording tasks for abandoned streams; held so they aren't collected.
+_BACKGROUND_TASKS: Set["asyncio.Task[None]"] = set()
+
+# One match per sentence: a run of text up to its terminator(s), or up to the
+# end for a trailing unterminated sentence.
+_SENT_RE = re.compile(r"[^.!?\s][^.!?]*(?:[.!?]+|$)")
+
+# Leading ```/```json and trailing ``` fences around model JSON output.
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+@lru_cache(maxsize=256)
+def _build_lower_map(categories: tuple[str, ...]) -> Dict[str, str]:
+    """Lower-cased label → canonical label; shared across repeated category sets."""
+    return {c.lower(): c for c in categories}
+
+
 class OrchestrationError(Exception):
     """Raised when orchestration cannot complete the request."""
 
@@ -49,16 +82,25 @@ class OrchestrationService:
 
     @staticmethod
     def _get_model_folder(operation: str) -> str:
-        folder = settings.OPERATION_MODEL_MAP.get(operation)
-        if not folder:
+        folder = _MODEL_FOLDER.get(operation)
+        if folder is None:
             raise OrchestrationError(
                 f"No model configured for operation '{operation}'."
             )
         return folder
 
+    @staticmethod
+    async def _get_model(model_folder: str) -> LoadedModel:
+        # Preloaded models are returned synchronously; only a cold model
+        # goes through get_or_load() and its load de-duplication.
+        loaded = model_registry.get(model_folder)
+        if loaded is None:
+            loaded = await model_registry.get_or_load(model_folder)
+        return loaded
+
     @staticmethod
     def _validate_input_length(operation: str, text: str) -> None:
-        max_chars = settings.MAX_INPUT_CHARS.get(operation, 0)
+        max_chars = _MAX_CHARS[operation]
         if max_chars and len(text) > max_chars:
             raise OrchestrationError(
                 f"Input exceeds hard limit for '{operation}': "
@@ -74,18 +116,20 @@ class OrchestrationService:
         session: AsyncSession,
     ) -> SummarizeResponse:
         operation = "summarize"
-        start = time.perf_counter()
+        start = time.monotonic_ns()
 
         cls._validate_input_length(operation, request.text)
 
         try:
             await LimitService.check_and_increment(session, operation)
         except LimitExceededError as exc:
-            logger.warning("Limit exceeded | op=%s", operation)
+            logger.warning(
+                "Limit exceeded | op=%s", operation, extra={"operation": operation}
+            )
             raise
 
         model_folder = cls._get_model_folder(operation)
-        loaded = await model_registry.get_or_load(model_folder)
+        loaded = await cls._get_model(model_folder)
 
         max_tokens = settings.MAX_OUTPUT_TOKENS[operation]
         prompt = build_summarize_prompt(request.text, request.max_sentences, request.language)
@@ -95,6 +139,7 @@ class OrchestrationService:
                 loaded=loaded,
                 prompt=prompt,
                 max_new_tokens=max_tokens,
+                prefix_key=operation,
             )
         except Exception as exc:
             logger.exception("Inference failed | op=%s", operation)
@@ -102,27 +147,170 @@ class OrchestrationService:
 
         await LimitService.record_tokens(session, operation, token_count)
 
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        sentence_count = len([s for s in generated_text.split(".") if s.strip()])
-
-        logger.info(
-            "op=summarize | chars=%d | tokens=%d | time=%.1fms | request_id=%s",
-            len(request.text), token_count, elapsed_ms, request.request_id,
-        )
+        elapsed_ms = (time.monotonic_ns() - start) / 1_000_000
+        sentence_count = sum(1 for _ in _SENT_RE.finditer(generated_text))
+
+        if INFO_ENABLED:
+            logger.info(
+                "op=summarize | chars=%d | tokens=%d | time=%.1fms | request_id=%s",
+                len(request.text), token_count, elapsed_ms, request.request_id,
+                extra={
+                    "operation": operation,
+                    "model": model_folder,
+                    "input_chars": len(request.text),
+                    "output_tokens": token_count,
+                    "elapsed_ms": elapsed_ms,
+                    "request_id": request.request_id,
+                },
+            )
 
-        return SummarizeResponse(
+        return SummarizeResponse.model_construct(
             summary=generated_text,
             sentence_count=sentence_count,
-            meta=OperationMeta(
+            meta=OperationMeta.model_construct(
                 operation=operation,
                 model_used=model_folder,
                 input_chars=len(request.text),
                 output_tokens=token_count,
-                execution_time_ms=round(elapsed_ms, 2),
+                execution_time_ms=elapsed_ms,
                 request_id=request.request_id,
             ),
         )
 
+    @classmethod
+    async def summarize_stream(
+        cls,
+        request: SummarizeRequest,
+        session: AsyncSession,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Streaming variant of summarize().  Limits are enforced and generation
+        is started before this returns, so failures up to that point surface
+        as regular errors; the returned iterator yields {"delta": str} events
+        followed by one final {"sentence_count": int, "meta": {...}} event.
+        """
+        operation = "summarize"
+        start = time.monotonic_ns()
+
+        cls._validate_input_length(operation, request.text)
+
+        try:
+            await LimitService.check_and_increment(session, operation)
+        except LimitExceededError:
+            logger.warning(
+                "Limit exceeded | op=%s", operation, extra={"operation": operation}
+            )
+            raise
+
+        model_folder = cls._get_model_folder(operation)
+        loaded = await cls._get_model(model_folder)
+
+        max_tokens = settings.MAX_OUTPUT_TOKENS[operation]
+        prompt = build_summarize_prompt(request.text, request.max_sentences, request.language)
+
+        try:
+            stream = InferenceEngine.stream(
+                loaded=loaded,
+                prompt=prompt,
+                max_new_tokens=max_tokens,
+                prefix_key=operation,
+            )
+        except Exception as exc:
+            logger.exception("Inference failed to start | op=%s", operation)
+            raise OrchestrationError(f"Inference error: {exc}") from exc
+
+        return cls._summarize_events(request, loaded, stream, start)
+
+    @classmethod
+    async def _summarize_events(
+        cls,
+        request: SummarizeRequest,
+        loaded: LoadedModel,
+        stream: InferenceStream,
+        start: int,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        operation = "summarize"
+        chunks: list[str] = []
+
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                yield {"delta": chunk}
+        except Exception as exc:
+            logger.exception("Inference failed | op=%s", operation)
+            raise OrchestrationError(f"Inference error: {exc}") from exc
+        except BaseException:
+            # Closed or cancelled because the client disconnected: free the
+            # model's executor now and still bill the tokens generated so far.
+            # This coroutine may not await any more, so record in a task.
+            stream.cancel()
+            task = asyncio.get_running_loop().create_task(
+                cls._record_abandoned_stream(stream, operation, request.request_id)
+            )
+            _BACKGROUND_TASKS.add(task)
+            task.add_done_callback(_BACKGROUND_TASKS.discard)
+            raise
+
+        token_count = stream.token_count
+        # The request-scoped session is not guaranteed to outlive the
+        # response headers, so record usage on a session of our own.
+        async with AsyncSessionFactory() as session:
+            await LimitService.record_tokens(session, operation, token_count)
+
+        generated_text = "".join(chunks).strip()
+        elapsed_ms = (time.monotonic_ns() - start) / 1_000_000
+        sentence_count = sum(1 for _ in _SENT_RE.finditer(generated_text))
+
+        if INFO_ENABLED:
+            logger.info(
+                "op=summarize | stream | chars=%d | tokens=%d | time=%.1fms | request_id=%s",
+                len(request.text), token_count, elapsed_ms, request.request_id,
+                extra={
+                    "operation": operation,
+                    "model": loaded.folder,
+                    "stream": True,
+                    "input_chars": len(request.text),
+                    "output_tokens": token_count,
+                    "elapsed_ms": elapsed_ms,
+                    "request_id": request.request_id,
+                },
+            )
+
+        meta = OperationMeta.model_construct(
+            operation=operation,
+            model_used=loaded.folder,
+            input_chars=len(request.text),
+            output_tokens=token_count,
+            execution_time_ms=elapsed_ms,
+            request_id=request.request_id,
+        )
+        yield {"sentence_count": sentence_count, "meta": meta.model_dump(mode="json")}
+
+    @staticmethod
+    async def _record_abandoned_stream(
+        stream: InferenceStream, operation: str, request_id: Optional[str]
+    ) -> None:
+        """Record usage for a stream whose client went away mid-generation."""
+        try:
+            token_count = await stream.wait()
+        except Exception:
+            logger.exception("Inference failed after disconnect | op=%s", operation)
+            return
+        async with AsyncSessionFactory() as session:
+            await LimitService.record_tokens(session, operation, token_count)
+        if INFO_ENABLED:
+            logger.info(
+                "op=%s | stream cancelled by client | tokens=%d | request_id=%s",
+                operation, token_count, request_id,
+                extra={
+                    "operation": operation,
+                    "stream": True,
+                    "cancelled": True,
+                    "output_tokens": token_count,
+                    "request_id": request_id,
+                },
+            )
+
     # ── Translate ─────────────────────────────────────────────────────────────
 
     @classmethod
@@ -132,18 +320,20 @@ class OrchestrationService:
         session: AsyncSession,
     ) -> TranslateResponse:
         operation = "translate"
-        start = time.perf_counter()
+        start = time.monotonic_ns()
 
         cls._validate_input_length(operation, request.text)
 
         try:
             await LimitService.check_and_increment(session, operation)
         except LimitExceededError:
-            logger.warning("Limit exceeded | op=%s", operation)
+            logger.warning(
+                "Limit exceeded | op=%s", operation, extra={"operation": operation}
+            )
             raise
 
         model_folder = cls._get_model_folder(operation)
-        loaded = await model_registry.get_or_load(model_folder)
+        loaded = await cls._get_model(model_folder)
 
         max_tokens = settings.MAX_OUTPUT_TOKENS[operation]
         prompt = build_translate_prompt(
@@ -155,6 +345,7 @@ class OrchestrationService:
                 loaded=loaded,
                 prompt=prompt,
                 max_new_tokens=max_tokens,
+                prefix_key=operation,
             )
         except Exception as exc:
             logger.exception("Inference failed | op=%s", operation)
@@ -162,24 +353,35 @@ class OrchestrationService:
 
         await LimitService.record_tokens(session, operation, token_count)
 
-        elapsed_ms = (time.perf_counter() - start) * 1000
-
-        logger.info(
-            "op=translate | src=%s | tgt=%s | chars=%d | tokens=%d | time=%.1fms",
-            request.source_language, request.target_language,
-            len(request.text), token_count, elapsed_ms,
-        )
+        elapsed_ms = (time.monotonic_ns() - start) / 1_000_000
+
+        if INFO_ENABLED:
+            logger.info(
+                "op=translate | src=%s | tgt=%s | chars=%d | tokens=%d | time=%.1fms",
+                request.source_language, request.target_language,
+                len(request.text), token_count, elapsed_ms,
+                extra={
+                    "operation": operation,
+                    "model": model_folder,
+                    "source_language": request.source_language,
+                    "target_language": request.target_language,
+                    "input_chars": len(request.text),
+                    "output_tokens": token_count,
+                    "elapsed_ms": elapsed_ms,
+                    "request_id": request.request_id,
+                },
+            )
 
-        return TranslateResponse(
+        return TranslateResponse.model_construct(
             translated_text=generated_text,
             source_language=request.source_language,
             target_language=request.target_language,
-            meta=OperationMeta(
+            meta=OperationMeta.model_construct(
                 operation=operation,
                 model_used=model_folder,
                 input_chars=len(request.text),
                 output_tokens=token_count,
-                execution_time_ms=round(elapsed_ms, 2),
+                execution_time_ms=elapsed_ms,
                 request_id=request.request_id,
             ),
         )
@@ -193,27 +395,40 @@ class OrchestrationService:
         session: AsyncSession,
     ) -> ClassifyResponse:
         operation = "classify"
-        start = time.perf_counter()
+        start = time.monotonic_ns()
 
         cls._validate_input_length(operation, request.text)
 
         try:
             await LimitService.check_and_increment(session, operation)
         except LimitExceededError:
-            logger.warning("Limit exceeded | op=%s", operation)
+            logger.warning(
+                "Limit exceeded | op=%s", operation, extra={"operation": operation}
+            )
             raise
 
         model_folder = cls._get_model_folder(operation)
-        loaded = await model_registry.get_or_load(model_folder)
+        loaded = await cls._get_model(model_folder)
 
         max_tokens = settings.MAX_OUTPUT_TOKENS[operation]
-        prompt = build_classify_prompt(request.text, request.categories)
+        categories = tuple(request.categories)
+        label_only = settings.CLASSIFY_LABEL_ONLY
+        prompt = build_classify_prompt(request.text, categories, label_only)
+
+        allowed_sequences = None
+        if label_only:
+            # Constrained to one label plus EOS, so the longest label bounds
+            # the output length.
+            allowed_sequences = InferenceEngine.label_token_ids(loaded, categories)
+            max_tokens = min(max_tokens, max(map(len, allowed_sequences)) + 1)
 
         try:
             generated_text, token_count = await InferenceEngine.generate(
                 loaded=loaded,
                 prompt=prompt,
                 max_new_tokens=max_tokens,
+                prefix_key=operation,
+                allowed_sequences=allowed_sequences,
             )
         except Exception as exc:
             logger.exception("Inference failed | op=%s", operation)
@@ -221,50 +436,66 @@ class OrchestrationService:
 
         await LimitService.record_tokens(session, operation, token_count)
 
-        # Parse JSON response from model.
-        label, confidence, scores = cls._parse_classify_output(
-            generated_text, request.categories
-        )
-
-        elapsed_ms = (time.perf_counter() - start) * 1000
-
-        logger.info(
-            "op=classify | categories=%d | label=%s | conf=%.2f | tokens=%d | time=%.1fms",
-            len(request.categories), label, confidence, token_count, elapsed_ms,
-        )
+        # Parse the label (or JSON object) returned by the model.
+        label, confidence, scores = cls._parse_classify_output(generated_text, categories)
+
+        elapsed_ms = (time.monotonic_ns() - start) / 1_000_000
+
+        if INFO_ENABLED:
+            logger.info(
+                "op=classify | categories=%d | label=%s | conf=%.2f | tokens=%d | time=%.1fms",
+                len(request.categories), label, confidence, token_count, elapsed_ms,
+                extra={
+                    "operation": operation,
+                    "model": model_folder,
+                    "categories": len(request.categories),
+                    "label": label,
+                    "confidence": confidence,
+                    "output_tokens": token_count,
+                    "elapsed_ms": elapsed_ms,
+                    "request_id": request.request_id,
+                },
+            )
 
-        return ClassifyResponse(
+        return ClassifyResponse.model_construct(
             label=label,
             confidence=confidence,
             scores=scores,
-            meta=OperationMeta(
+            meta=OperationMeta.model_construct(
                 operation=operation,
                 model_used=model_folder,
                 input_chars=len(request.text),
                 output_tokens=token_count,
-                execution_time_ms=round(elapsed_ms, 2),
+                execution_time_ms=elapsed_ms,
                 request_id=request.request_id,
             ),
         )
 
     @staticmethod
     def _parse_classify_output(
-        raw: str, categories: list[str]
+        raw: str, categories: tuple[str, ...]
     ) -> tuple[str, float, dict[str, float]]:
         """
-        Attempt to parse model JSON output.  Falls back gracefully if the
-        model returns malformed JSON.
+        Parse model output: a bare category name (label-only prompts) is
+        taken as-is with full confidence; anything else is parsed as JSON,
+        falling back gracefully if the model returns malformed JSON.
         """
+        lower_map = _build_lower_map(categories)
+        canonical = lower_map.get(raw.strip().lower())
+        if canonical is not None:
+            scores = dict.fromkeys(categories, 0.0)
+            scores[canonical] = 1.0
+            return canonical, 1.0, scores
+
         try:
             # Strip markdown fences if present.
-            cleaned = raw.strip().strip("```json").strip("```").strip()
-            data = json.loads(cleaned)
+            cleaned = _FENCE_RE.sub("", raw.strip())
+            data = orjson.loads(cleaned)
             label = str(data.get("label", categories[0]))
             confidence = float(data.get("confidence", 0.5))
             confidence = max(0.0, min(1.0, confidence))
 
             # Ensure label is one of the provided categories (case-insensitive).
-            lower_map = {c.lower(): c for c in categories}
             canonical = lower_map.get(label.lower())
             if canonical is None:
                 label = categories[0]
@@ -272,14 +503,14 @@ class OrchestrationService:
             else:
                 label = canonical
 
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (orjson.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
             logger.warning("Could not parse classify output as JSON: %s", raw[:200])
             label = categories[0]
             confidence = 0.5
 
         # Build a simple scores dict: assigned label gets confidence, rest share remainder.
         remaining = (1.0 - confidence) / max(len(categories) - 1, 1)
-        scores = {c: remaining for c in categories}
+        scores = dict.fromkeys(categories, remaining)
         scores[label] = confidence
 
         return label, confidence, scores
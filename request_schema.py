@@ -1,9 +1,11 @@
 """
 Strict Pydantic request schemas for all operations.
-Every field is explicitly typed and validated.
+Every field is explicitly typed and validated.  Simple checks (stripping,
+lengths, enumerations) are declared as constraints so pydantic-core runs
+them natively; only cross-item/cross-field logic lives in Python validators.
 """
-from typing import Annotated, Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Literal, Optional, get_args
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator, model_validator
 
 
 # ── Shared base ───────────────────────────────────────────────────────────────
@@ -11,7 +13,7 @@ from pydantic import BaseModel, Field, field_validator
 class BaseOperationRequest(BaseModel):
     """Common fields shared by all operation requests."""
 
-    model_config = {"strict": True}
+    model_config = ConfigDict(strict=True, extra="forbid", frozen=True)
 
     request_id: Optional[str] = Field(
         default=None,
@@ -25,6 +27,7 @@ class BaseOperationRequest(BaseModel):
 class SummarizeRequest(BaseOperationRequest):
     text: Annotated[
         str,
+        StringConstraints(strip_whitespace=True),
         Field(
             min_length=50,
             max_length=8000,
@@ -49,24 +52,18 @@ class SummarizeRequest(BaseOperationRequest):
         ),
     ]
 
-    @field_validator("text")
-    @classmethod
-    def text_must_not_be_whitespace_only(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("text must not consist solely of whitespace.")
-        return value.strip()
-
 
 # ── Translate ─────────────────────────────────────────────────────────────────
 
-SUPPORTED_LANGUAGES: set[str] = {
-    "en", "ar", "fr", "de", "es", "zh", "ja", "ko", "ru", "pt",
-}
+LanguageCode = Literal["en", "ar", "fr", "de", "es", "zh", "ja", "ko", "ru", "pt"]
+
+SUPPORTED_LANGUAGES: frozenset[str] = frozenset(get_args(LanguageCode))
 
 
 class TranslateRequest(BaseOperationRequest):
     text: Annotated[
         str,
+        StringConstraints(strip_whitespace=True),
         Field(
             min_length=1,
             max_length=4000,
@@ -74,44 +71,19 @@ class TranslateRequest(BaseOperationRequest):
         ),
     ]
     source_language: Annotated[
-        str,
-        Field(
-            pattern=r"^[a-z]{2}$",
-            description="ISO 639-1 code of the source language.",
-        ),
+        LanguageCode,
+        Field(description="ISO 639-1 code of the source language."),
     ]
     target_language: Annotated[
-        str,
-        Field(
-            pattern=r"^[a-z]{2}$",
-            description="ISO 639-1 code of the target language.",
-        ),
+        LanguageCode,
+        Field(description="ISO 639-1 code of the target language."),
     ]
 
-    @field_validator("source_language", "target_language")
-    @classmethod
-    def language_must_be_supported(cls, value: str) -> str:
-        if value not in SUPPORTED_LANGUAGES:
-            raise ValueError(
-                f"Language '{value}' is not supported. "
-                f"Supported languages: {sorted(SUPPORTED_LANGUAGES)}"
-            )
-        return value
-
-    @field_validator("target_language")
-    @classmethod
-    def languages_must_differ(cls, target: str, info) -> str:
-        source = info.data.get("source_language")
-        if source and source == target:
+    @model_validator(mode="after")
+    def languages_must_differ(self) -> "TranslateRequest":
+        if self.source_language == self.target_language:
             raise ValueError("source_language and target_language must differ.")
-        return target
-
-    @field_validator("text")
-    @classmethod
-    def text_must_not_be_whitespace_only(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("text must not consist solely of whitespace.")
-        return value.strip()
+        return self
 
 
 # ── Classify ──────────────────────────────────────────────────────────────────
@@ -119,6 +91,7 @@ class TranslateRequest(BaseOperationRequest):
 class ClassifyRequest(BaseOperationRequest):
     text: Annotated[
         str,
+        StringConstraints(strip_whitespace=True),
         Field(
             min_length=1,
             max_length=2000,
@@ -126,7 +99,7 @@ class ClassifyRequest(BaseOperationRequest):
         ),
     ]
     categories: Annotated[
-        list[str],
+        list[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]],
         Field(
             min_length=2,
             max_length=20,
@@ -136,20 +109,11 @@ class ClassifyRequest(BaseOperationRequest):
 
     @field_validator("categories")
     @classmethod
-    def categories_must_be_unique_and_non_empty(cls, values: list[str]) -> list[str]:
-        cleaned = [c.strip() for c in values if c.strip()]
-        if len(cleaned) < 2:
-            raise ValueError("At least 2 non-empty category labels are required.")
-        if len(cleaned) != len(set(c.lower() for c in cleaned)):
+    def categories_must_be_unique(cls, values: list[str]) -> list[str]:
+        # Items are already stripped and non-empty (see StringConstraints).
+        if len(values) != len({c.lower() for c in values}):
             raise ValueError("Category labels must be unique (case-insensitive).")
-        return cleaned
-
-    @field_validator("text")
-    @classmethod
-    def text_must_not_be_whitespace_only(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("text must not consist solely of whitespace.")
-        return value.strip()
+        return values
 
 
 # ── Limit update ──────────────────────────────────────────────────────────────
@@ -1,9 +1,14 @@
 """
 Strict Pydantic response schemas for all operations and management endpoints.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
+
+
+def utc_now() -> datetime:
+    """Timezone-aware UTC timestamp for response default factories."""
+    return datetime.now(timezone.utc)
 
 
 # ── Operation responses ───────────────────────────────────────────────────────
@@ -15,7 +20,11 @@ class OperationMeta(BaseModel):
     output_tokens: int
     execution_time_ms: float
     request_id: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
+
+    @field_serializer("execution_time_ms")
+    def _round_execution_time(self, value: float) -> float:
+        return round(value, 2)
 
 
 class SummarizeResponse(BaseModel):
@@ -53,7 +62,7 @@ class HealthResponse(BaseModel):
     memory_total_mb: float
     cpu_percent: float
     models: List[ModelStatus]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 # ── Limits & usage ────────────────────────────────────────────────────────────
@@ -80,7 +89,7 @@ class OperationUsage(BaseModel):
 
 class UsageResponse(BaseModel):
     usage: List[OperationUsage]
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=utc_now)
 
 
 # ── Generic error ─────────────────────────────────────────────────────────────
@@ -88,4 +97,4 @@ class UsageResponse(BaseModel):
 class ErrorResponse(BaseModel):
     error: str
     detail: Optional[Any] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
@@ -1,13 +1,17 @@
 """
 Operations API routes.
 All routes delegate entirely to OperationService / OrchestrationService.
-No business logic lives here.
+No business logic lives here; service errors are mapped to HTTP responses
+by the exception handlers registered in main.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Union
+
+import orjson
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
-from app.core.logging import get_logger
 from app.core.security import require_api_key
 from app.schemas.request_schema import ClassifyRequest, SummarizeRequest, TranslateRequest
 from app.schemas.response_schema import (
@@ -16,38 +20,18 @@ from app.schemas.response_schema import (
     SummarizeResponse,
     TranslateResponse,
 )
-from app.services.limit_service import LimitExceededError
 from app.services.operation_service import OperationService
 from app.services.orchestration_service import OrchestrationError
 
-logger = get_logger(__name__)
-
 router = APIRouter(prefix="/operations", tags=["Operations"])
 
 
-def _handle_operation_errors(exc: Exception) -> None:
-    """Translate service-layer exceptions to HTTP responses."""
-    if isinstance(exc, LimitExceededError):
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=str(exc),
-        )
-    if isinstance(exc, OrchestrationError):
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(exc),
-        )
-    logger.exception("Unexpected error during operation.")
-    raise HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="An unexpected internal error occurred.",
-    )
-
-
 @router.post(
     "/summarize",
-    response_model=SummarizeResponse,
+    response_model=None,
+    response_class=ORJSONResponse,
     responses={
+        200: {"model": SummarizeResponse, "content": {"application/x-ndjson": {}}},
         422: {"model": ErrorResponse},
         429: {"model": ErrorResponse},
         500: {"model": ErrorResponse},
@@ -55,26 +39,99 @@ def _handle_operation_errors(exc: Exception) -> None:
     summary="Summarize text",
     description=(
         "Generates a concise summary of the provided text. "
-        "Input length is hard-capped at 8000 characters."
+        "Input length is hard-capped at 8000 characters. "
+        "With `?stream=true` the summary is returned as newline-delimited "
+        "JSON: one `{\"delta\": ...}` line per text chunk, then a final line "
+        "with `sentence_count` and `meta`."
     ),
 )
 async def summarize(
+    request: Request,
     body: SummarizeRequest,
+    stream: bool = Query(default=False, description="Stream the summary as NDJSON."),
     session: AsyncSession = Depends(get_session),
     _api_key: str = Depends(require_api_key),
-) -> SummarizeResponse:
+) -> Union[SummarizeResponse, StreamingResponse]:
+    if stream:
+        events = await OperationService.summarize_stream(body, session)
+        return StreamingResponse(
+            _ndjson_stream(_until_disconnected(request, events)),
+            media_type="application/x-ndjson",
+        )
+    return await OperationService.summarize(body, session)
+
+
+async def _until_disconnected(
+    request: Request, events: AsyncGenerator[Dict[str, Any], None]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Pass events through until the client disconnects, then close the source
+    so the service stops generation instead of running to max_new_tokens.
+    """
+    try:
+        async for event in events:
+            if await request.is_disconnected():
+                break
+            yield event
+    finally:
+        await events.aclose()
+
+
+async def _ndjson_stream(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode service events as newline-delimited JSON."""
     try:
-        return await OperationService.summarize(body, session)
-    except (LimitExceededError, OrchestrationError) as exc:
-        _handle_operation_errors(exc)
-    except Exception as exc:
-        _handle_operation_errors(exc)
+        async for event in events:
+            yield orjson.dumps(event) + b"\n"
+    except OrchestrationError as exc:
+        # Headers are already sent – report the failure in-band.
+        yield orjson.dumps({"error": str(exc)}) + b"\n"
+
+
+async def _sse_stream(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode service events as Server-Sent Events frames."""
+    try:
+        async for event in events:
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+    except OrchestrationError as exc:
+        # Headers are already sent – report the failure in-band.
+        yield b"event: error\ndata: " + orjson.dumps({"error": str(exc)}) + b"\n\n"
+
+
+@router.post(
+    "/summarize/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        422: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+    summary="Summarize text (streaming)",
+    description=(
+        "Same as /operations/summarize, but streams the summary as "
+        "Server-Sent Events: one `{\"delta\": ...}` frame per text chunk, "
+        "then a final frame with `sentence_count` and `meta`."
+    ),
+)
+async def summarize_stream(
+    request: Request,
+    body: SummarizeRequest,
+    session: AsyncSession = Depends(get_session),
+    _api_key: str = Depends(require_api_key),
+) -> StreamingResponse:
+    events = await OperationService.summarize_stream(body, session)
+    return StreamingResponse(
+        _sse_stream(_until_disconnected(request, events)),
+        media_type="text/event-stream",
+    )
 
 
 @router.post(
     "/translate",
-    response_model=TranslateResponse,
+    response_model=None,
+    response_class=ORJSONResponse,
     responses={
+        200: {"model": TranslateResponse},
         422: {"model": ErrorResponse},
         429: {"model": ErrorResponse},
         500: {"model": ErrorResponse},
@@ -91,18 +148,15 @@ async def translate(
     session: AsyncSession = Depends(get_session),
     _api_key: str = Depends(require_api_key),
 ) -> TranslateResponse:
-    try:
-        return await OperationService.translate(body, session)
-    except (LimitExceededError, OrchestrationError) as exc:
-        _handle_operation_errors(exc)
-    except Exception as exc:
-        _handle_operation_errors(exc)
+    return await OperationService.translate(body, session)
 
 
 @router.post(
     "/classify",
-    response_model=ClassifyResponse,
+    response_model=None,
+    response_class=ORJSONResponse,
     responses={
+        200: {"model": ClassifyResponse},
         422: {"model": ErrorResponse},
         429: {"model": ErrorResponse},
         500: {"model": ErrorResponse},
@@ -119,9 +173,4 @@ async def classify(
     session: AsyncSession = Depends(get_session),
     _api_key: str = Depends(require_api_key),
 ) -> ClassifyResponse:
-    try:
-        return await OperationService.classify(body, session)
-    except (LimitExceededError, OrchestrationError) as exc:
-        _handle_operation_errors(exc)
-    except Exception as exc:
-        _handle_operation_errors(exc)
+    return await OperationService.classify(body, session)
@@ -7,6 +7,7 @@ from typing import Any, Dict
 from fastapi import APIRouter, Depends
 
 from app.core.config import settings
+from app.core.database import pool_status
 from app.core.security import require_api_key
 from app.health.health_check import HealthCheck
 from app.schemas.response_schema import HealthResponse
@@ -40,3 +41,13 @@ async def get_settings() -> Dict[str, Any]:
         "max_output_tokens": settings.MAX_OUTPUT_TOKENS,
         "default_daily_limit": settings.DEFAULT_DAILY_LIMIT,
     }
+
+
+@router.get(
+    "/debug/pool",
+    summary="Database pool status",
+    description="Returns the SQLAlchemy connection pool status for observability.",
+    dependencies=[Depends(require_api_key)],
+)
+async def get_pool_status() -> Dict[str, Any]:
+    return {"pool": pool_status()}
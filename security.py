@@ -1,6 +1,8 @@
 """
 Security layer: API key validation via FastAPI dependency injection.
 """
+import hashlib
+
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader
 
@@ -11,6 +13,12 @@ logger = get_logger(__name__)
 
 _api_key_scheme = APIKeyHeader(name=settings.API_KEY_HEADER, auto_error=True)
 
+# Keys are compared by SHA-256 digest: lookup is O(1) regardless of how many
+# keys are configured, and timing no longer depends on the raw key bytes.
+_VALID_KEY_HASHES: frozenset[bytes] = frozenset(
+    hashlib.sha256(key.encode()).digest() for key in settings.VALID_API_KEYS
+)
+
 
 async def require_api_key(api_key: str = Security(_api_key_scheme)) -> str:
     """
@@ -19,7 +27,7 @@ async def require_api_key(api_key: str = Security(_api_key_scheme)) -> str:
     Raises:
         HTTPException 403 if the key is absent or invalid.
     """
-    if api_key not in settings.VALID_API_KEYS:
+    if hashlib.sha256(api_key.encode()).digest() not in _VALID_KEY_HASHES:
         logger.warning("Rejected request with invalid API key: %s…", api_key[:8])
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,